@@ -5,19 +5,673 @@ Unified OCR Pipeline for PDF Processing
 Handles PyMuPDF import issues with fallback backends
 """
 
+import io
 import logging
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 import json
-import subprocess
+import time
+# ProcessPoolExecutor is imported where pools are built: concurrent.futures
+# loads it (and multiprocessing) lazily, which keeps CLI start-up light
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import groupby
+
+
+def _fast_page_text(page, y_tolerance: float = 3, x_tolerance: float = 3) -> str:
+    """Flat text dump of a pdfplumber page built straight from page.chars.
+
+    Skips pdfplumber's word/layout clustering: characters are grouped into
+    lines by their top coordinate, ordered left to right, and a space is
+    inserted wherever the horizontal gap exceeds x_tolerance.
+    """
+    lines = []
+    line = []
+    line_top = None
+    for char in sorted(page.chars, key=lambda c: (c["top"], c["x0"])):
+        if line_top is None or char["top"] - line_top > y_tolerance:
+            if line:
+                lines.append(line)
+            line = []
+            line_top = char["top"]
+        line.append(char)
+    if line:
+        lines.append(line)
+
+    text_lines = []
+    for line in lines:
+        line.sort(key=lambda c: c["x0"])
+        parts = []
+        prev_x1 = None
+        for char in line:
+            if prev_x1 is not None and char["x0"] - prev_x1 > x_tolerance:
+                parts.append(" ")
+            parts.append(char["text"])
+            prev_x1 = char["x1"]
+        text_lines.append("".join(parts))
+    return "\n".join(text_lines)
+
+
+def _page_has_xobject(page) -> bool:
+    """Cheap check of a pdfplumber page's raw /Resources for an XObject entry.
+
+    Reads the pdfminer page object directly so text-only pages never pay for
+    the content-stream walk behind page.images.
+    """
+    try:
+        resources = page.page_obj.resources or {}
+        return bool(resources.get("XObject"))
+    except Exception:
+        # Unusual resource dictionaries: let page.images decide
+        return True
+
+
+def _quick_accept_image(doc, xref: int) -> bool:
+    """Decide from the image's ColorSpace entry whether it can be OCR'd.
+
+    Avoids decoding a Pixmap only to discard it: CMYK images fail the
+    pix.n - pix.alpha < 4 check, anything else (including indirect ICC
+    colour spaces) is accepted and verified once the Pixmap exists.
+    """
+    try:
+        _, colorspace = doc.xref_get_key(xref, "ColorSpace")
+    except Exception:
+        return True
+    return "CMYK" not in colorspace
+
+
+# PO number detection, tried in order on the first two pages
+_PO_PATTERNS = [
+    re.compile(r"Purchase\s*[Oo]rder\s*(\d{10})", re.IGNORECASE),
+    re.compile(r"PO\s*[:\-]?\s*(\d{10})", re.IGNORECASE),
+    re.compile(r"(45\d{8})"),
+    re.compile(r"(\d{10})"),
+]
+
+
+# Seconds after a successful Ollama generate during which the /api/tags
+# reachability probe is skipped
+_OLLAMA_ALIVE_TTL = 60.0
+
+# Keywords whose presence marks OCR output as PO-like text
+_OCR_PO_INDICATORS = ('purchase order', 'po', 'meggitt', 'vendor', 'date')
+_DIGIT_RE = re.compile(r"\d")
+
+# Common OCR digit confusions: 5 vs 6, 3 vs 8, 0 vs 8, 1 vs 7. A digit can
+# be mistaken for more than one other (8 for both 3 and 0).
+_OCR_DIGIT_CONFUSIONS = {
+    '5': ('6',), '6': ('5',),
+    '3': ('8',), '8': ('3', '0'),
+    '0': ('8',),
+    '1': ('7',), '7': ('1',),
+}
+
+
+def _search_po_candidate(text: str) -> Optional[str]:
+    """First _PO_PATTERNS hit in priority order, as the captured digits.
+
+    Every pattern needs a ten-digit run, so one scan for the first run
+    rules out pages without one, doubles as the catch-all last pattern's
+    answer, and gives the 45-prefix pattern its earliest possible start.
+    """
+    first_run = _PO_PATTERNS[3].search(text)
+    if first_run is None:
+        return None
+    for pattern in _PO_PATTERNS[:2]:
+        po_match = pattern.search(text)
+        if po_match:
+            return po_match.group(1)
+    po_match = _PO_PATTERNS[2].search(text, first_run.start())
+    if po_match:
+        return po_match.group(1)
+    return first_run.group(1)
+
+# Field extraction patterns
+_VENDOR_ADDRESS_RE = re.compile(r"Vendor address[^\n]*\n([^\n]+)", re.IGNORECASE)
+_LEADING_NUMBER_RE = re.compile(r'^\d+\s')
+_COMPANY_NAME_RE = re.compile(r"([A-Z][A-Z\s,\.&]+(?:INC|LLC|CORP|COMPANY|CO|ENTERPRISES)[A-Z\s,\.]*)", re.IGNORECASE)
+_PART_NUMBER_RE = re.compile(r"(\d{6}-\d+[A-Z]*)")
+_QUANTITY_RE = re.compile(r"Quantity[:\s]*(\d+\.?\d*)", re.IGNORECASE)
+_NET_PER_PRICE_RE = re.compile(r"Net Per[:\s]*UM[:\s]*Dockdate[:\s]*Net[:\s]*.*?(\d+,\d+\.\d+)", re.IGNORECASE | re.DOTALL)
+_PO_NUMBER_RE = re.compile(r"(45\d{8})")
+_PRODUCTION_ORDER_RE = re.compile(r"Production Order[:\s]*(\d+)", re.IGNORECASE)
+_MJO_NUMBER_RE = re.compile(r"(\d{8,12})")
+_PART_WITH_OP_RE = re.compile(r"(\d{6}-?\d*[A-Z]*)\s+(OP\d+)", re.IGNORECASE)
+_PART_ASSEMBLY_RE = re.compile(r"(\d{6}-?\d*[A-Z]*)\s+(\w+\d+)\s+(?:ASSEMBLY|BODY ASSY)", re.IGNORECASE)
+_DASH_OP_SUFFIX_RE = re.compile(r'-OP(\d+)$')
+_DPAS_RE = re.compile(r"DPAS[:\s]*([A-Z]\d+)", re.IGNORECASE)
+_QUALITY_CLAUSE_RE = re.compile(r"(Q\d+)\s+([A-Z][A-Z\s,\[\]()]+?)(?=\s*Q\d+|\s*$|\n\n)", re.IGNORECASE | re.DOTALL)
+_QUALITY_CLAUSE_STANDALONE_RE = re.compile(r"(Q\d+)\s*([A-Z][A-Z\s,\[\]()]{10,50})", re.IGNORECASE)
+
+# Keyword-anchored fields resolved from a single finditer() pass per page.
+# Every branch is a zero-width lookahead so overlapping fields (e.g. "Date"
+# inside "Delivery Date") are all seen; branches must start on distinct
+# keywords so that two fields never compete for the same position. Fields
+# that do share a start ("Delivery ...", a digit run) sit in one branch as
+# optional lookaheads, which are all tried at that position.
+# The leading class lists every branch's possible first character, so most
+# positions are rejected with one set lookup instead of trying each branch
+# in turn; extend it when adding a branch (\u017f is the long s that
+# IGNORECASE matches for "S").
+_FIELD_SCAN_RE = re.compile(r"(?=[\dDdEeVvBbPpMmTtNnAaQqSs\u017f$])(?:" + "|".join([
+    r"(?=(?i:Delivery))"
+    r"(?:(?=(?i:Delivery Date[^\n]*\n[^\n]*?(?P<delivery_date>\d{1,2}/\d{1,2}/\d{4}))))?"
+    r"(?:(?=(?i:Delivery Date[^\n]*\n[^\n]*Quantity[^\n]*\n[^\n]*?(?P<qty_delivery_section>\d+\.?\d*))))?"
+    r"(?:(?=(?i:Delivery[^\n]*?(?P<qty_delivery>\d+\.?\d*))))?",
+    r"(?=(?i:Dockdate[:\s]*(?P<dock_date>\d{1,2}/\d{1,2}/\d{4})))",
+    r"(?=(?i:EA[^\n]*?(?P<ea_date>\d{1,2}/\d{1,2}/\d{4})))",
+    r"(?=(?i:Date[:\s]*(?P<date>\d{1,2}[/\-]\d{1,2}[/\-]\d{4})))",
+    r"(?=(?i:Vendor number[:\s]*(?P<vendor_number>\d+)))",
+    r"(?=(?i:Buyer/phone[:\s]*(?P<buyer_name>[^/]+)))"
+    r"(?:(?=(?i:Buyer/phone[:\s]*[^/]+/\s*(?P<buyer_phone>\d{3}-\d{3}-\d{4}))))?",
+    r"(?=(?i:Buyer E-mail[:\s]*(?P<buyer_email>[^\s]+@[^\s]+)))",
+    r"(?=(?i:Production Order[:\s]*(?P<production_order>\d+)))",
+    r"(?=(?i:MJO[:\s#]*(?P<mjo>\d+)))",
+    r"(?=(?i:Payment terms[:\s]*(?P<payment_terms>[^\\n]+)))",
+    r"(?=\d)"
+    r"(?:(?=(?P<long_number>\d{9,12})))?"  # 9-12 digit numbers
+    r"(?:(?=(?i:(?P<qty_ea>\d+\.?\d*)\s*EA)))?"
+    r"(?:(?=(?i:(?P<qty_each>\d+\.?\d*)\s*(?:EACH|EA)\b)))?"
+    r"(?:(?=\b(?P<qty_number>\d{1,4})\b(?!\d)))?",  # 1-4 digits not followed by more digits
+    # Quantity shipped keywords
+    r"(?=(?i:QTY[:\s]*(?P<qty_qty>\d+\.?\d*)))",
+    r"(?=(?i:Quantity[:\s]*(?P<qty_quantity>\d+\.?\d*)))",
+    r"(?=(?i:Ship\s*Qty[:\s]*(?P<qty_ship>\d+\.?\d*)))",
+    r"(?=(?i:Shipped[:\s]*(?P<qty_shipped>\d+\.?\d*)))",
+    # Amount candidates, highest priority first
+    r"(?=(?i:Total amount[:\s]*(?P<amount_total>[\d,]+\.?\d*)))",
+    r"(?=(?i:Net value[:\s]*(?P<amount_net>[\d,]+\.?\d*)))",
+    r"(?=(?i:amount[:\s]*\$?(?P<amount_any>[\d,]+\.?\d*)))",
+    r"(?=\$[\s]*(?P<amount_dollar>[\d,]+\.?\d*))",
+]) + ")")
+
+_FIELD_SCAN_GROUP_COUNT = len(_FIELD_SCAN_RE.groupindex)
+
+# Quantity-shipped candidates, highest priority first
+_QTY_SHIP_GROUPS = (
+    "qty_delivery_section",  # number on the line after a Delivery Date / Quantity header
+    "qty_qty",               # QTY followed by number
+    "qty_quantity",          # Quantity followed by number
+    "qty_ea",                # number followed by EA (each)
+    "qty_ship",              # Ship Qty
+    "qty_shipped",           # Shipped quantity
+    "qty_each",              # number before "EACH" or "EA"
+    "qty_delivery",          # Delivery quantity
+    "qty_number",            # any standalone number (last resort, see _qty_ship_groups)
+)
+
+# Fields _scan_all resolves; once all are set later pages aren't scanned
+_SCANNED_FIELDS = ("date", "vendor_number", "buyer_name", "buyer_phone", "buyer_email",
+                   "delivery_date", "production_order", "payment_terms", "amount",
+                   "quantity_shipped")
+
+
+def _scan_page_fields(text: str) -> Dict[str, str]:
+    """First hit for every _FIELD_SCAN_RE group in one pass over the text"""
+    hits: Dict[str, str] = {}
+    for match in _FIELD_SCAN_RE.finditer(text):
+        for name, value in match.groupdict().items():
+            if value is not None and name not in hits:
+                hits[name] = value
+        if len(hits) == _FIELD_SCAN_GROUP_COUNT:
+            # Every field has its first hit; the rest of the page can't change it
+            break
+    return hits
+
+
+# Enhanced OCR configuration for pytesseract, and the whitelist it sets for
+# the equivalent tesserocr block-mode API. PO scans are dark text on a light
+# background, so the per-line inverted re-recognition pass is switched off.
+_TESSERACT_BLOCK_CONFIG = r'--oem 3 --psm 6 -c tessedit_do_invert=0 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,/:-()\\ '
+# Low-confidence retry with automatic page segmentation
+_TESSERACT_AUTO_CONFIG = r'--oem 3 --psm 3'
+_OCR_CHAR_WHITELIST = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,/:-()\\"
+
+# FileMaker fields counted when deciding whether regex extraction is good
+# enough to skip the Ollama round-trip. Whittaker_Shipper is left out: it is
+# the PO number, which regex always fills (UNKNOWN_PO at worst).
+_REQUIRED_FILEMAKER_FIELDS = (
+    "MJO_NO", "QTY_SHIP", "PART_NUMBER",
+    "Promise_Delivery_Date", "DPAS_Rating", "Payment_Terms_Flag", "Quality_Clauses",
+)
+
+_MIN_PAGES_FOR_POOL = 4
+
+# Per-process state for page-analysis workers: the pipeline and the one
+# document currently open, as (doc_key, doc)
+_worker_pipeline = None
+_worker_doc: Optional[tuple] = None
+
+
+class _FallbackOCRResult(tuple):
+    """(text, confidence) from the plain image_to_string fallback after the
+    scored OCR failed; kept out of the OCR cache so a transient failure
+    does not pin degraded text to the page"""
+
+
+def _limit_tesseract_threads():
+    """Default OMP_THREAD_LIMIT=1 for this process and the tesseract it runs.
+
+    Tesseract's OpenMP threads only contend with the page/file worker pools
+    for the same cores. Called from main() and the pool initializers, which
+    own their processes, before any tesseract starts so both tesserocr and
+    pytesseract's subprocess pick it up; library users set it themselves.
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def _pool_context():
+    """multiprocessing context for the page and file worker pools.
+
+    Pools can be built while background writer or delete threads are
+    running, and fork() then copies whatever locks those threads hold into
+    the workers; forkserver (spawn where unavailable) starts them clean.
+    """
+    import multiprocessing
+
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _default_page_workers() -> int:
+    return min(os.cpu_count() or 1, 4)
+
+
+def _init_page_worker(config: Dict[str, Any]):
+    """Process-pool initializer: build one pipeline per worker"""
+    global _worker_pipeline
+    _limit_tesseract_threads()
+    _worker_pipeline = UnifiedOCRPipeline(config)
+
+
+def _analyze_page_worker(pdf_path: str, doc_key: str, page_num: int) -> tuple:
+    """Analyze one page in a worker, keeping the document open between pages.
+
+    Workers outlive a single PDF, so the open document is swapped out when
+    a page of a different file (or a rewritten one, per doc_key) arrives.
+    Returns (page_result, ocr_cache_hits, ocr_cache_misses) so the parent's
+    cache_stats() covers pages analyzed here.
+    """
+    global _worker_doc
+    if _worker_doc is None or _worker_doc[0] != doc_key:
+        if _worker_doc is not None:
+            _worker_doc[1].close()
+        _worker_doc = (doc_key, _worker_pipeline._open_fitz_document(Path(pdf_path))[0])
+    hits, misses = _worker_pipeline._ocr_cache_hits, _worker_pipeline._ocr_cache_misses
+    page_result = _worker_pipeline._analyze_page(_worker_doc[1], page_num)
+    return (page_result, _worker_pipeline._ocr_cache_hits - hits,
+            _worker_pipeline._ocr_cache_misses - misses)
+
+
+# Per-process state for file-level workers started by main()
+_file_worker_pipeline = None
+
+_SUMMARY_KEYS = ("po_number", "total_pages", "total_text_length", "total_images", "processing_time_seconds")
+
+
+def _default_file_workers(config: Dict[str, Any]) -> int:
+    """File worker processes; each loads its own OpenCV/tesseract stack"""
+    return config.get("max_concurrent_files") or int(os.getenv("MAX_CONCURRENT_FILES", "2"))
+
+
+def _init_file_worker(config: Dict[str, Any]):
+    """Process-pool initializer: build one pipeline per file worker"""
+    global _file_worker_pipeline
+    _limit_tesseract_threads()
+    _file_worker_pipeline = UnifiedOCRPipeline(config)
+
+
+def _summarize_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields main() reports, small enough to send back from a worker"""
+    return {key: results.get(key) for key in _SUMMARY_KEYS}
+
+
+def _process_file_worker(pdf_path: str) -> Dict[str, Any]:
+    return _summarize_results(_file_worker_pipeline.process_pdf(pdf_path))
+
+
+def _process_files(pipeline, pdf_files: List[str], workers: int):
+    """Yield (pdf_file, summary, error) for each PDF as it finishes.
+
+    With more than one worker the PDFs are spread over a process pool
+    (each worker analyzes its pages serially so the pools don't
+    oversubscribe the CPUs); otherwise they run in this process.
+    """
+    if workers <= 1:
+        for pdf_file in pdf_files:
+            try:
+                yield pdf_file, _summarize_results(pipeline.process_pdf(pdf_file)), None
+            except Exception as e:
+                yield pdf_file, None, e
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    config = dict(pipeline.config, page_workers=1)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(),
+                             initializer=_init_file_worker,
+                             initargs=(config,)) as executor:
+        futures = {executor.submit(_process_file_worker, pdf_file): pdf_file for pdf_file in pdf_files}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as e:
+                yield futures[future], None, e
+
+
+def _claim_po_output_dir(base_output_dir: Path, po_number: str, timestamp: str,
+                         source_record: str, suffixed: bool = False) -> tuple:
+    """Claim and return (po_number, folder) for a PO's output.
+
+    The claim is the {po}_data.src sidecar, created with O_EXCL and holding
+    source_record ("path\ncontent_hash"), so of two file workers resolving
+    to the same PO (UNKNOWN_PO included) only one writes into a folder. A
+    folder whose sidecar names this same source, with no JSON yet (an
+    interrupted run), is reused; one holding another PDF's output falls
+    back to {po}_{HHMMSS}, then {po}_{HHMMSS}_2 and so on. suffixed skips
+    the plain name when it is already known to be taken.
+    """
+    source_path = source_record.partition("\n")[0]
+    attempt = 1 if suffixed else 0
+    while True:
+        if attempt == 0:
+            candidate = po_number
+        elif attempt == 1:
+            candidate = f"{po_number}_{timestamp}"
+        else:
+            candidate = f"{po_number}_{timestamp}_{attempt}"
+        folder = base_output_dir / candidate
+        folder.mkdir(parents=True, exist_ok=True)
+        sidecar = folder / f"{candidate}_data.src"
+        try:
+            fd = os.open(sidecar, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            try:
+                claimed_by = sidecar.read_text(encoding="utf-8").partition("\n")[0]
+            except OSError:
+                claimed_by = ""
+            if claimed_by == source_path and not (folder / f"{candidate}_data.json").exists():
+                return candidate, folder
+            attempt += 1
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(source_record)
+        return candidate, folder
+
+
+def _page_ranges(page_numbers: List[int]) -> List[tuple]:
+    """Collapse sorted page indices into inclusive (start, end) runs"""
+    ranges = []
+    for _, run in groupby(enumerate(page_numbers), key=lambda item: item[1] - item[0]):
+        run = list(run)
+        ranges.append((run[0][1], run[-1][1]))
+    return ranges
+
+
+def _save_page_subset(doc, page_numbers: List[int], output_path: Path, save_options: Dict[str, Any]) -> bool:
+    """Copy the given pages of doc into a new PDF at output_path.
+
+    Contiguous runs go in with one insert_pdf call each; an empty
+    selection builds no document at all. Returns whether a file was saved.
+    """
+    if not page_numbers:
+        return False
+
+    import fitz
+
+    subset = fitz.open()
+    try:
+        for start, end in _page_ranges(page_numbers):
+            subset.insert_pdf(doc, from_page=start, to_page=end)
+        subset.save(str(output_path), **save_options)
+    finally:
+        subset.close()
+    return True
+
+
+def _content_hash(pdf_path: Path, data=None) -> str:
+    """128-bit BLAKE2b of the PDF bytes, to recognise renamed duplicates.
+
+    data, when given, is the file's bytes already in memory (the buffer
+    PyMuPDF was opened from), which is hashed instead of re-reading it.
+    """
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=16)
+    if data is not None:
+        digest.update(data)
+        return digest.hexdigest()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Two-space indented UTF-8 JSON, encoded by orjson when it is installed.
+
+    Falls back to the stdlib encoder for anything orjson rejects (e.g.
+    integers beyond 64 bits), so the output never depends on it.
+    """
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """json.loads through orjson when it is installed.
+
+    Input orjson rejects but the stdlib accepts (NaN, integers beyond 64
+    bits) is re-parsed with json.loads, so results never depend on it.
+    Errors are json.JSONDecodeError either way.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+# On-disk JSON caches (Ollama responses, page OCR results): one file per key
+# in a cache directory, bounded by an entry-count env var
+
+def _load_json_cache(cache_path: Optional[Path]) -> Optional[Any]:
+    """Return a cache entry, or None when there is none or it is unreadable"""
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_json_cache(cache_path: Path, obj: Any, max_entries_env: str) -> None:
+    """Atomically write a cache entry, then prune the directory to the
+    limit in max_entries_env. Raises OSError when the write fails."""
+    import tempfile
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # A temp name of its own per writer: two workers caching the same key
+    # must not write into, or replace away, each other's file
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _prune_json_cache(cache_path.parent, int(os.getenv(max_entries_env, "500")))
+
+
+def _prune_json_cache(cache_dir: Path, max_entries: int) -> None:
+    """Drop the least recently written entries beyond max_entries (0 = unbounded)"""
+    if max_entries <= 0:
+        return
+    with os.scandir(cache_dir) as it:
+        entries = [entry for entry in it if entry.name.endswith(".json")]
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    for entry in entries[:len(entries) - max_entries]:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+_PAGE_BREAK = "\n\n--- PAGE BREAK ---\n\n"
+_PAGE_BREAK_BYTES = _PAGE_BREAK.encode("utf-8")
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+# Linux caps a single writev() at 1024 buffers
+_IOV_MAX = 1024
+
+
+def _write_files(files: List[tuple]) -> None:
+    """Write (path, data) pairs with one raw open/write/close per file
+
+    data is either bytes or a list of byte chunks; chunks go out through
+    os.writev as a gather write, so they are never joined into one copy.
+    """
+    for path, payload in files:
+        chunks = [payload] if isinstance(payload, (bytes, bytearray, memoryview)) else payload
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            _write_chunks(fd, chunks)
+        finally:
+            os.close(fd)
+
+
+def _write_chunks(fd: int, chunks: List[bytes]) -> None:
+    """Write every chunk to fd, resuming after short writes"""
+    pending = [memoryview(chunk) for chunk in chunks if chunk]
+    writev = getattr(os, "writev", None)
+    index = 0
+    while index < len(pending):
+        if writev:
+            written = writev(fd, pending[index:index + _IOV_MAX])
+        else:
+            written = os.write(fd, pending[index])
+        while written:
+            head = pending[index]
+            if written >= len(head):
+                written -= len(head)
+                index += 1
+            else:
+                pending[index] = head[written:]
+                written = 0
+
+
+def _with_page_breaks(encoded_pages: List[bytes]) -> List[bytes]:
+    """Interleave encoded pages with the page-break marker for a gather write"""
+    chunks = []
+    for encoded in encoded_pages:
+        if chunks:
+            chunks.append(_PAGE_BREAK_BYTES)
+        chunks.append(encoded)
+    return chunks
+
+
+def _has_text(text: str) -> bool:
+    """bool(text.strip()) without copying the page text"""
+    return bool(text) and not text.isspace()
+
+
+_PIXMAP_MODES = {(1, 0): "L", (2, 1): "LA", (3, 0): "RGB", (4, 1): "RGBA"}
+
+
+def _pixmap_to_image(pix):
+    """Wrap a PyMuPDF Pixmap's samples in a PIL image without touching disk"""
+    from PIL import Image
+
+    mode = _PIXMAP_MODES[(pix.n, pix.alpha)]
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+
+def _cap_scan_dpi(image, page_side_pt: float, max_dpi: int):
+    """Downscale a page scan whose resolution exceeds max_dpi, measured
+    along the longer side so rotated pages give the same answer.
+
+    Printed POs read no better above ~300 DPI, while every extra pixel costs
+    preprocessing and Tesseract time. Oversized scans are reduced to
+    grayscale first so the box resample touches one channel.
+    """
+    if max_dpi <= 0 or page_side_pt <= 0:
+        return image
+    dpi = max(image.size) * 72.0 / page_side_pt
+    if dpi <= max_dpi:
+        return image
+    from PIL import Image
+
+    scale = max_dpi / dpi
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    if image.mode != "L":
+        image = image.convert("L")
+    return image.resize(size, Image.BOX)
+
+
+# 2*identity - PIL's SMOOTH filter ([[1,1,1],[1,5,1],[1,1,1]] / 13); kept as a
+# nested list so numpy is only imported when OCR actually runs
+_SHARPEN_2X_KERNEL_ROWS = [[-1 / 13, -1 / 13, -1 / 13],
+                           [-1 / 13, 2 - 5 / 13, -1 / 13],
+                           [-1 / 13, -1 / 13, -1 / 13]]
+
+
+def _preprocess_for_ocr(image):
+    """Cheap binarization before Tesseract: grayscale, Otsu threshold and a
+    light 2x2 dilation that clears isolated dark specks"""
+    import cv2
+    import numpy as np
+    from PIL import Image
+
+    gray = np.array(image.convert("L"))
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    binary = cv2.dilate(binary, np.ones((2, 2), np.uint8), iterations=1)
+    # 1bpp lets Tesseract skip its own thresholding pass
+    return Image.fromarray(binary).convert("1", dither=Image.Dither.NONE)
+
+
+_HEALTH_DEPENDENCIES = ("fitz", "pypdfium2", "pdfplumber", "pytesseract", "PIL")
+
+# Module behind each PDF backend, in default preference order
+_BACKEND_MODULES = (("fitz", "pymupdf"), ("pypdfium2", "pypdfium2"), ("pdfplumber", "pdfplumber"))
+
 
 class UnifiedOCRPipeline:
+    # Dependency probe results shared by every instance; imports don't
+    # change during the life of the process
+    _dependency_status: Optional[Dict[str, str]] = None
+
     def __init__(self, config: Dict[str, Any] = None):
         self.config = config or {}
+        self._tess_apis: Dict[str, Any] = {}
+        self._tessdata_dir: Optional[str] = None
+        self.ocr_model = "best"
+        self._page_pool = None  # ProcessPoolExecutor, built on first use
+        self._page_pool_workers = 0
+        self._ollama_alive_until = 0.0  # time.monotonic() deadline for skipping the /api/tags probe
+        self._ocr_cache_key_prefix: Optional[bytes] = None
+        self._ocr_cache_hits = 0
+        self._ocr_cache_misses = 0
         self.logger = self._setup_logging()
+        self._select_ocr_model(self.config.get("ocr_model") or os.getenv("OCR_MODEL", "best"))
         self.pdf_backend = self._initialize_pdf_backend()
         
     def _setup_logging(self):
@@ -39,6 +693,29 @@ class UnifiedOCRPipeline:
         )
         return logging.getLogger(__name__)
     
+    def _select_ocr_model(self, model: str):
+        """Point tesseract at the tessdata_fast (int8 LSTM) models when asked.
+
+        "best" keeps the tessdata installed with tesseract; "fast" reads
+        eng.traineddata from TESSDATA_FAST_DIR and stays on "best" if it
+        isn't there.
+        """
+        if model != "fast":
+            return
+        fast_dir = os.getenv("TESSDATA_FAST_DIR", str(Path(__file__).resolve().parent.parent / "tessdata_fast"))
+        if not os.path.isfile(os.path.join(fast_dir, "eng.traineddata")):
+            self.logger.warning(f"⚠️  No eng.traineddata in {fast_dir}, using the default tesseract model")
+            return
+        self._tessdata_dir = fast_dir
+        self.ocr_model = "fast"
+        self.logger.info(f"⚡ Using fast tesseract model from {fast_dir}")
+
+    def _tesseract_config(self, config: str) -> str:
+        """Add --tessdata-dir to a pytesseract config when a model dir is set"""
+        if self._tessdata_dir:
+            return f'--tessdata-dir "{self._tessdata_dir}" {config}'
+        return config
+
     def _initialize_pdf_backend(self):
         """Initialize PDF processing backend with fallbacks"""
         self.logger.info("Initializing PDF backend...")
@@ -46,19 +723,28 @@ class UnifiedOCRPipeline:
         # Try PyMuPDF first
         try:
             import fitz
+            # MuPDF warnings about malformed PDFs otherwise go straight to stderr
+            fitz.TOOLS.mupdf_display_errors(False)
             self.logger.info("✅ Using PyMuPDF backend")
             return "pymupdf"
         except ImportError as e:
             self.logger.warning(f"⚠️  PyMuPDF not available: {e}")
             
-        # Fallback to pdfplumber
-        try:
-            import pdfplumber
-            self.logger.info("✅ Using pdfplumber backend (fallback)")
-            return "pdfplumber"
-        except ImportError:
-            self.logger.error("❌ No PDF backend available!")
-            return None
+        # Fall back to pypdfium2 for plain text, or to pdfplumber first when
+        # its layout-aware extraction was asked for
+        fallbacks = ["pypdfium2", "pdfplumber"]
+        if self.config.get("high_fidelity_layout", False):
+            fallbacks.reverse()
+        for backend in fallbacks:
+            try:
+                __import__(backend)
+            except ImportError:
+                continue
+            self.logger.info(f"✅ Using {backend} backend (fallback)")
+            return backend
+
+        self.logger.error("❌ No PDF backend available!")
+        return None
     
     def health_check(self) -> Dict[str, Any]:
         """System health check"""
@@ -66,19 +752,49 @@ class UnifiedOCRPipeline:
             "timestamp": datetime.now().isoformat(),
             "pdf_backend": self.pdf_backend,
             "status": "healthy" if self.pdf_backend else "unhealthy",
+            "ocr_model": self.ocr_model,
             "dependencies": {}
         }
         
-        # Check dependencies
-        deps = ["fitz", "pdfplumber", "pytesseract", "PIL"]
-        for dep in deps:
-            try:
-                __import__(dep)
-                status["dependencies"][dep] = "available"
-            except ImportError:
-                status["dependencies"][dep] = "missing"
+        # Check dependencies once per process
+        if UnifiedOCRPipeline._dependency_status is None:
+            dependencies = {}
+            for dep in _HEALTH_DEPENDENCIES:
+                try:
+                    __import__(dep)
+                    dependencies[dep] = "available"
+                except ImportError:
+                    dependencies[dep] = "missing"
+            UnifiedOCRPipeline._dependency_status = dependencies
+        status["dependencies"] = dict(UnifiedOCRPipeline._dependency_status)
         
         return status
+
+    @classmethod
+    def quick_health(cls) -> Dict[str, Any]:
+        """Health status without building a pipeline.
+
+        Looks up module specs and the tesseract binary instead of importing
+        anything, so it is cheap enough for frequent container probes.
+        """
+        import importlib.util
+        import shutil
+
+        dependencies = {
+            dep: "available" if importlib.util.find_spec(dep) else "missing"
+            for dep in _HEALTH_DEPENDENCIES
+        }
+        dependencies["tesseract"] = "available" if shutil.which("tesseract") else "missing"
+        pdf_backend = next(
+            (backend for module, backend in _BACKEND_MODULES if dependencies[module] == "available"),
+            None
+        )
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "pdf_backend": pdf_backend,
+            "status": "healthy" if pdf_backend else "unhealthy",
+            "dependencies": dependencies
+        }
     
     def process_pdf(self, pdf_path: str, output_dir: str = None) -> Dict[str, Any]:
         """Main OCR processing function"""
@@ -103,141 +819,265 @@ class UnifiedOCRPipeline:
 
         self.logger.info(f"Processing PDF: {pdf_path}")
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         if self.pdf_backend == "pymupdf":
             results = self._process_with_pymupdf(pdf_path, base_output_dir)
+        elif self.pdf_backend == "pypdfium2":
+            results = self._process_with_pypdfium2(pdf_path, base_output_dir)
         elif self.pdf_backend == "pdfplumber":
-            results = self._process_with_pdfplumber(pdf_path, base_output_dir)
+            results = self._process_with_pdfplumber(
+                pdf_path, base_output_dir,
+                high_fidelity_layout=self.config.get("high_fidelity_layout", False)
+            )
         else:
             raise Exception(f"Unknown backend: {self.pdf_backend}")
 
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         results["processing_time_seconds"] = processing_time
         results["timestamp"] = datetime.now().isoformat()
 
         self.logger.info(f"✅ Processing complete in {processing_time:.2f}s")
         return results
     
+    def _open_fitz_document(self, pdf_path: Path):
+        """Read a PDF once and open it with PyMuPDF from memory.
+
+        Returns (doc, data) where data is the file's bytes, the stream type
+        every PyMuPDF release accepts (1.23's Document rejects an mmap), so
+        callers can hash the PDF without reading it again.
+        """
+        import fitz
+
+        data = pdf_path.read_bytes()
+        return fitz.open(stream=data, filetype="pdf"), data
+
     def _process_with_pymupdf(self, pdf_path: Path, base_output_dir: Path) -> Dict[str, Any]:
         """Process PDF using PyMuPDF"""
+        self.logger.info("Processing with PyMuPDF...")
+
+        doc, data = self._open_fitz_document(pdf_path)
+        try:
+            return self._process_fitz_document(doc, pdf_path, base_output_dir, source_bytes=data)
+        finally:
+            doc.close()
+
+    def _extract_page(self, doc, page_num: int) -> tuple:
+        """Extract text and image counts for one page.
+
+        Returns (page_result, ocr_image) where ocr_image is the enhanced PIL
+        image still waiting for forced OCR, or None.
+        """
         import fitz
 
-        self.logger.info("Processing with PyMuPDF...")
+        page = doc.load_page(page_num)
 
-        doc = fitz.open(pdf_path)
-        results = {
-            "source_file": str(pdf_path),
-            "pages": [],
-            "total_pages": len(doc),
-            "backend": "pymupdf",
-            "total_text_length": 0,
-            "total_images": 0,
-            "po_number": None
+        # Extract plain text only: whitespace kept, no ligature or image
+        # bookkeeping, since only the raw string is used
+        text = page.get_text("text", flags=fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP)
+
+        has_text = _has_text(text)
+        needs_ocr = page_num < 2 and not has_text
+
+        # Extract images for potential OCR. Listing them walks the page's
+        # resources, so other pages are only counted when count_page_images
+        # is on (images_found is 0 otherwise).
+        image_list = page.get_images() if needs_ocr or self._count_page_images() else ()
+
+        page_result = {
+            "page_number": page_num + 1,
+            "text": text,
+            "text_length": len(text),
+            "images_found": len(image_list),
+            "has_text": has_text
         }
 
-        po_pages: List[int] = []
-        po_number: Optional[str] = None
+        # Force OCR for first 2 pages if no text found. Classify the
+        # images first so a Pixmap is only built for one we can OCR.
+        ocr_xref = None
+        if needs_ocr and image_list:
+            ocr_xref = next(
+                (img[0] for img in image_list if _quick_accept_image(doc, img[0])),
+                None
+            )
+            if ocr_xref is None:
+                self.logger.warning("No OCR-compatible image on page %d", page_num + 1)
+
+        if ocr_xref is not None:
+            self.logger.info("Forced OCR for page %d", page_num + 1)
+            try:
+                pix = fitz.Pixmap(doc, ocr_xref)
+                if pix.alpha:
+                    # OCR ignores transparency; dropping it in MuPDF keeps
+                    # the buffer PIL wraps a plane smaller
+                    pix = fitz.Pixmap(pix, 0)
+                if pix.n < 4:
+                    # Hand the pixel buffer to PIL in memory (no PNG round-trip)
+                    image = _pixmap_to_image(pix)
+                    pix = None
+                    image = _cap_scan_dpi(image, max(page.rect.width, page.rect.height),
+                                          self._ocr_max_dpi())
+                    return page_result, self._preprocess_ocr_image(image)
+            except Exception as e:
+                self.logger.error("OCR failed for page %d: %s", page_num + 1, e)
+
+        return page_result, None
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+    def _apply_ocr_result(self, page_result: Dict[str, Any], ocr_text: str, ocr_confidence: float):
+        """Record forced-OCR output on a page result and use it as the page text"""
+        page_num = page_result["page_number"]
+        # Per-page messages use lazy %-formatting so the repr and the string
+        # building are skipped when INFO is filtered out
+        self.logger.info("OCR result for page %d: %r", page_num, ocr_text[:100])
+        self.logger.info("OCR confidence for page %d: %.2f%%", page_num, ocr_confidence)
+        
+        page_result["ocr_text"] = ocr_text
+        page_result["ocr_text_length"] = len(ocr_text)
+        page_result["ocr_confidence"] = ocr_confidence
+        page_result["ocr_quality"] = self._assess_ocr_quality(ocr_text, ocr_confidence)
+        
+        # Use OCR text as main text for this page
+        page_result["text"] = ocr_text
+        page_result["text_length"] = len(ocr_text)
 
-            # Extract text
-            text = page.get_text()
+    def _analyze_page(self, doc, page_num: int) -> Dict[str, Any]:
+        """Extract text and image counts for one page, forcing OCR when needed"""
+        page_result, ocr_image = self._extract_page(doc, page_num)
+        if ocr_image is not None:
+            try:
+                cache_path, ocr_result = self._cached_ocr(ocr_image)
+                if ocr_result is None:
+                    ocr_result = self._run_enhanced_ocr(ocr_image, page_num + 1)
+                    self._store_cached_ocr(cache_path, ocr_result)
+                self._apply_ocr_result(page_result, *ocr_result)
+            except Exception as e:
+                self.logger.error("OCR failed for page %d: %s", page_num + 1, e)
+        return page_result
 
-            # Extract images for potential OCR
-            image_list = page.get_images()
+    def _analyze_pages(self, doc, pdf_path: Path) -> List[Dict[str, Any]]:
+        """Analyze every page, fanning out to a process pool for larger PDFs.
 
-            page_result = {
-                "page_number": page_num + 1,
-                "text": text,
-                "text_length": len(text),
-                "images_found": len(image_list),
-                "has_text": bool(text.strip())
-            }
+        Workers reopen the PDF by path, so only the page index crosses the
+        process boundary. Small documents (the common 2-3 page PO) stay
+        serial because pool start-up would cost more than it saves.
+        """
+        total_pages = len(doc)
+        pool_workers = self.config.get("page_workers") or int(os.getenv("OCR_PAGE_WORKERS", str(_default_page_workers())))
+        workers = min(pool_workers, total_pages)
 
-            # Force OCR for first 2 pages if no text found
-            if page_num < 2 and (not text.strip()) and image_list:
-                self.logger.info(f"Forced OCR for page {page_num + 1}")
+        if workers > 1 and total_pages >= _MIN_PAGES_FOR_POOL:
+            self.logger.info(f"Analyzing {total_pages} pages with {workers} worker processes")
+            try:
+                stat = os.stat(pdf_path)
+                doc_key = f"{pdf_path}:{stat.st_mtime_ns}:{stat.st_size}"
+                pool = self._get_page_pool(pool_workers)
+                page_results = []
+                for page_result, hits, misses in pool.map(_analyze_page_worker,
+                                                          [str(pdf_path)] * total_pages,
+                                                          [doc_key] * total_pages,
+                                                          range(total_pages)):
+                    page_results.append(page_result)
+                    self._ocr_cache_hits += hits
+                    self._ocr_cache_misses += misses
+                return page_results
+            except Exception as e:
+                self.logger.warning(f"Parallel page analysis failed, continuing serially: {e}")
+                self._shutdown_page_pool()
+
+        extracted = [self._extract_page(doc, page_num) for page_num in range(total_pages)]
+        pending = [(page_result, image) for page_result, image in extracted if image is not None]
+
+        # Pages whose preprocessed image was OCR'd before come from the cache
+        cached = [self._cached_ocr(image) for _, image in pending]
+        ocr_results = [ocr_result for _, ocr_result in cached]
+        misses = [index for index, ocr_result in enumerate(ocr_results) if ocr_result is None]
+        to_ocr = [pending[index] for index in misses]
+
+        # Without tesserocr every pytesseract call starts a tesseract process;
+        # send all forced-OCR pages through a single invocation instead.
+        if len(to_ocr) > 1 and self._get_tesserocr_api("block") is None:
+            fresh_results = self._run_enhanced_ocr_batch(
+                [image for _, image in to_ocr],
+                [page_result["page_number"] for page_result, _ in to_ocr]
+            )
+        else:
+            fresh_results = []
+            for page_result, image in to_ocr:
                 try:
-                    import pytesseract
-                    from PIL import Image, ImageEnhance, ImageFilter
-                    import cv2
-                    import numpy as np
-                    
-                    xref = image_list[0][0]
-                    pix = fitz.Pixmap(doc, xref)
-                    if pix.n - pix.alpha < 4:
-                        temp_img_path = f"/tmp/page_{page_num + 1:03d}_ocr.png"
-                        pix.save(temp_img_path)
-                        pix = None
-                        self.logger.info(f"Saved image for OCR: {temp_img_path}")
-                        
-                        # ENHANCED IMAGE PREPROCESSING
-                        enhanced_img_path = self._enhance_image_for_ocr(temp_img_path)
-                        
-                        # Run OCR with enhanced settings
-                        ocr_text, ocr_confidence = self._run_enhanced_ocr(enhanced_img_path, page_num + 1)
-                        
-                        self.logger.info(f"OCR result for page {page_num + 1}: {repr(ocr_text[:100])}")
-                        self.logger.info(f"OCR confidence for page {page_num + 1}: {ocr_confidence:.2f}%")
-                        
-                        page_result["ocr_text"] = ocr_text
-                        page_result["ocr_text_length"] = len(ocr_text)
-                        page_result["ocr_confidence"] = ocr_confidence
-                        page_result["ocr_quality"] = self._assess_ocr_quality(ocr_text, ocr_confidence)
-                        
-                        # Use OCR text as main text for this page
-                        text = ocr_text
-                        page_result["text"] = text
-                        page_result["text_length"] = len(text)
+                    fresh_results.append(self._run_enhanced_ocr(image, page_result["page_number"]))
                 except Exception as e:
-                    self.logger.error(f"OCR failed for page {page_num + 1}: {e}")
+                    self.logger.error("OCR failed for page %d: %s", page_result["page_number"], e)
+                    fresh_results.append(None)
+
+        for index, ocr_result in zip(misses, fresh_results):
+            ocr_results[index] = ocr_result
+            if ocr_result is not None:
+                self._store_cached_ocr(cached[index][0], ocr_result)
+
+        for (page_result, _), ocr_result in zip(pending, ocr_results):
+            if ocr_result is not None:
+                self._apply_ocr_result(page_result, *ocr_result)
+
+        return [page_result for page_result, _ in extracted]
+
+    def _process_fitz_document(self, doc, pdf_path: Path, base_output_dir: Path,
+                               source_bytes=None) -> Dict[str, Any]:
+        """Extract, split and save an already opened PyMuPDF document.
+
+        source_bytes is the file content the document was opened from, if
+        any, so the content hash reuses it instead of reading the PDF again.
+        """
+        import fitz
+
+        # One wall-clock reading for the duplicate suffix and the JSON stamp
+        processed_at = datetime.now()
+
+        page_results = self._analyze_pages(doc, pdf_path)
+
+        # Column views over the per-page dicts for the whole-document passes
+        texts = [page_result["text"] for page_result in page_results]
+        image_counts = [page_result["images_found"] for page_result in page_results]
 
+        results = {
+            "source_file": str(pdf_path),
+            "pages": page_results,
+            "total_pages": len(page_results),
+            "backend": "pymupdf",
+            "total_text_length": sum(map(len, texts)),
+            "total_images": sum(image_counts),
+            "po_number": None
+        }
+
+        po_pages: List[int] = []
+        po_number: Optional[str] = None
+
+        for page_num, text in enumerate(texts):
             # PO extraction: try to find PO number from OCR or text with validation
-            if page_num < 2 and page_result.get("text") and not po_number:
-                import re
-                
-                # Try multiple PO extraction patterns with validation
-                text_to_search = page_result["text"]
+            if page_num < 2 and text and not po_number:
+                # Try multiple PO extraction patterns with validation:
+                # "Purchase order" + 10 digits, "PO:" + 10 digits, any
+                # 10-digit number starting with 45, any 10-digit number
+                candidate_po = _search_po_candidate(text)
                 
-                # Pattern 1: Purchase order + 10 digits
-                po_match = re.search(r"Purchase\s*[Oo]rder\s*(\d{10})", text_to_search, re.IGNORECASE)
-                if not po_match:
-                    # Pattern 2: PO: + 10 digits  
-                    po_match = re.search(r"PO\s*[:\-]?\s*(\d{10})", text_to_search, re.IGNORECASE)
-                if not po_match:
-                    # Pattern 3: Any 10-digit number starting with 45
-                    po_match = re.search(r"(45\d{8})", text_to_search)
-                if not po_match:
-                    # Pattern 4: Any 10-digit number (last resort)
-                    po_match = re.search(r"(\d{10})", text_to_search)
-                
-                if po_match:
-                    candidate_po = po_match.group(1)
-                    
+                if candidate_po:
                     # Validate PO number format (should start with 45 and be 10 digits)
                     if len(candidate_po) == 10 and candidate_po.startswith('45'):
                         # Additional validation: check for common OCR errors
                         # 5 vs 6, 3 vs 8, 0 vs 8, etc.
-                        if self._validate_po_number(candidate_po, text_to_search):
+                        if self._validate_po_number(candidate_po, text):
                             po_number = candidate_po
                             results["po_number"] = po_number
-                            page_result["po_number"] = po_number
-                            self.logger.info(f"Extracted PO number from page {page_num + 1}: {po_number}")
+                            page_results[page_num]["po_number"] = po_number
+                            self.logger.info("Extracted PO number from page %d: %s", page_num + 1, po_number)
                         else:
-                            self.logger.warning(f"PO number failed validation: {candidate_po}")
+                            self.logger.warning("PO number failed validation: %s", candidate_po)
                     else:
-                        self.logger.warning(f"Invalid PO format: {candidate_po} (should be 10 digits starting with 45)")
+                        self.logger.warning("Invalid PO format: %s (should be 10 digits starting with 45)", candidate_po)
 
             # Determine if this page is part of PO (first 2 pages typically)
-            if page_num < 2 or (page_result.get("text") and "purchase order" in page_result.get("text", "").lower()):
+            if page_num < 2 or (text and "purchase order" in text.lower()):
                 po_pages.append(page_num)
 
-            results["pages"].append(page_result)
-            results["total_text_length"] += len(text)
-            results["total_images"] += len(image_list)
-
         # Create output directory structure with duplicate detection
         if not po_number:
             po_number = "UNKNOWN_PO"
@@ -246,233 +1086,265 @@ class UnifiedOCRPipeline:
         po_output_dir = base_output_dir / po_number
         
         # Check if this PO was already processed (prevent duplicates)
+        different_source = False
+        content_hash = _content_hash(pdf_path, source_bytes)
         existing_json = po_output_dir / f"{po_number}_data.json"
         if existing_json.exists():
             self.logger.warning(f"PO {po_number} already processed, checking for duplicates...")
             
-            # Read existing data to compare
+            # Compare source path and content hash; the .src sidecar holds
+            # just those two lines, so the JSON is only parsed for output
+            # written before it existed
             try:
-                import json
-                with open(existing_json, 'r') as f:
-                    existing_data = json.load(f)
+                try:
+                    sidecar = (po_output_dir / f"{po_number}_data.src").read_text(encoding="utf-8")
+                    existing_source, _, existing_hash = sidecar.partition("\n")
+                except FileNotFoundError:
+                    with open(existing_json, 'r') as f:
+                        existing_data = json.load(f)
                     existing_source = existing_data.get('source_file', '')
-                    current_source = str(pdf_path)
-                    
-                    if existing_source == current_source:
-                        self.logger.warning(f"Duplicate processing detected for {pdf_path.name} → PO {po_number}")
-                        return results  # Skip duplicate processing
-                    else:
-                        self.logger.info(f"Different source file for same PO: {existing_source} vs {current_source}")
-                        # Continue processing but add suffix to avoid conflicts
-                        timestamp = datetime.now().strftime("%H%M%S")
-                        po_number = f"{po_number}_{timestamp}"
-                        po_output_dir = base_output_dir / po_number
+                    existing_hash = existing_data.get('content_hash', '')
+                current_source = str(pdf_path)
+                if existing_source == current_source:
+                    self.logger.warning(f"Duplicate processing detected for {pdf_path.name} → PO {po_number}")
+                    return results  # Skip duplicate processing
+                elif existing_hash == content_hash:
+                    self.logger.warning(f"Duplicate content detected for {pdf_path.name} (same as {existing_source}) → PO {po_number}")
+                    return results  # Renamed copy of an already processed PDF
+                else:
+                    self.logger.info(f"Different source file for same PO: {existing_source} vs {current_source}")
+                    # Continue processing but add suffix to avoid conflicts
+                    different_source = True
             except Exception as e:
                 self.logger.warning(f"Could not check existing data: {e}")
         
+        po_number, po_output_dir = _claim_po_output_dir(
+            base_output_dir, po_number, processed_at.strftime("%H%M%S"),
+            f"{pdf_path}\n{content_hash}", suffixed=different_source
+        )
         misc_dir = po_output_dir / "Misc"
-        po_output_dir.mkdir(parents=True, exist_ok=True)
         misc_dir.mkdir(exist_ok=True)
 
+        # Save misc files (text extracts, images, etc.)
+        # Each page is encoded once; the combined file reuses those bytes.
+        # Per-page files are opt-in since the combined files hold the same text.
+        per_page = self._save_per_page_text()
+        misc_files = []
+        encoded_pages = []
+        encoded_ocr = []
+        for page_result in results["pages"]:
+            page_num = page_result["page_number"]
+            encoded = page_result.get("text", "").encode("utf-8")
+            encoded_pages.append(encoded)
+            if per_page:
+                misc_files.append((misc_dir / f"page_{page_num:03d}.txt", encoded))
+
+            if page_result.get("ocr_text"):
+                ocr_encoded = page_result["ocr_text"].encode("utf-8")
+                if per_page:
+                    misc_files.append((misc_dir / f"page_{page_num:03d}_ocr.txt", ocr_encoded))
+                else:
+                    encoded_ocr.append(f"--- PAGE {page_num} ---\n".encode("utf-8") + ocr_encoded)
+
+        # Save combined text
+        misc_files.append((misc_dir / f"{pdf_path.stem}_combined.txt", _with_page_breaks(encoded_pages)))
+        if encoded_ocr:
+            misc_files.append((misc_dir / f"{pdf_path.stem}_ocr_combined.txt", b"\n\n".join(encoded_ocr)))
+
+        # The text extracts only depend on the page results, so they go out
+        # on a background thread while the PDFs are split and saved and the
+        # FileMaker data is extracted
+        writer = ThreadPoolExecutor(max_workers=1)
+        misc_writes = writer.submit(_write_files, misc_files)
+        writer.shutdown(wait=False)
+
         # Split PDF: Create PO PDF and Router PDF
-        po_doc = fitz.open()
-        router_doc = fitz.open()
+        po_page_set = set(po_pages)
+        router_pages = [page_num for page_num in range(len(doc)) if page_num not in po_page_set]
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            if page_num in po_pages:
-                po_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
-            else:
-                router_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
+        # Split output is a straight page copy: source streams keep their
+        # compression, so skip xref garbage collection and re-deflating
+        # unless smaller files are explicitly wanted
+        save_deflate = bool(self.config.get("save_deflate", False))
+        save_options = {
+            "garbage": 3 if save_deflate else 0,
+            "deflate": save_deflate,
+            "clean": False,
+            "pretty": False,
+        }
 
         # Save PO PDF
         po_pdf_path = po_output_dir / f"{po_number}_PO.pdf"
-        if po_doc.page_count > 0:
-            po_doc.save(str(po_pdf_path))
+        if _save_page_subset(doc, po_pages, po_pdf_path, save_options):
             self.logger.info(f"Saved PO PDF: {po_pdf_path}")
 
         # Save Router PDF
         router_pdf_path = po_output_dir / f"{po_number}_Router.pdf"
-        if router_doc.page_count > 0:
-            router_doc.save(str(router_pdf_path))
+        if _save_page_subset(doc, router_pages, router_pdf_path, save_options):
             self.logger.info(f"Saved Router PDF: {router_pdf_path}")
 
         # Save JSON file for FileMaker
         json_data = {
             "po_number": po_number,
             "source_file": str(pdf_path),
-            "processing_timestamp": datetime.now().isoformat(),
+            "processing_timestamp": processed_at.isoformat(),
             "po_pages": len(po_pages),
             "router_pages": len(doc) - len(po_pages),
             "total_pages": len(doc),
+            "content_hash": content_hash,
             "extracted_data": self._extract_filemaker_data_with_ai(results, po_number)
         }
 
         json_file_path = po_output_dir / f"{po_number}_data.json"
-        with open(json_file_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        # Serialize up front: json.dump would issue one write() per token.
+        # The .src sidecar written when the folder was claimed lets the
+        # duplicate check skip parsing the JSON.
+        _write_files([(json_file_path, _json_bytes(json_data))])
         self.logger.info(f"Saved JSON data: {json_file_path}")
 
-        # Save misc files (text extracts, images, etc.)
-        for page_result in results["pages"]:
-            page_num = page_result["page_number"]
-            text_file = misc_dir / f"page_{page_num:03d}.txt"
-            text_file.write_text(page_result.get("text", ""), encoding='utf-8')
-
-            if page_result.get("ocr_text"):
-                ocr_text_file = misc_dir / f"page_{page_num:03d}_ocr.txt"
-                ocr_text_file.write_text(page_result["ocr_text"], encoding='utf-8')
-
-        # Save combined text
-        all_text = "\n\n--- PAGE BREAK ---\n\n".join([p.get("text", "") for p in results["pages"]])
-        combined_file = misc_dir / f"{pdf_path.stem}_combined.txt"
-        combined_file.write_text(all_text, encoding='utf-8')
-
-        doc.close()
-        po_doc.close()
-        router_doc.close()
+        misc_writes.result()  # re-raise any text write error
 
         return results
     
+    def _save_per_page_text(self) -> bool:
+        """Whether to write page_NNN.txt files next to the combined text"""
+        if "save_per_page_text" in self.config:
+            return bool(self.config["save_per_page_text"])
+        return os.getenv("SAVE_PER_PAGE_TEXT", "false").lower() == "true"
+    
+    def _count_page_images(self) -> bool:
+        """Whether PyMuPDF pages that will not be OCR'd still list their images"""
+        if "count_page_images" in self.config:
+            return bool(self.config["count_page_images"])
+        return os.getenv("COUNT_PAGE_IMAGES", "false").lower() == "true"
+    
+    def _ocr_max_dpi(self) -> int:
+        """Resolution forced-OCR page scans are capped at (0 = keep as embedded)"""
+        if "ocr_max_dpi" in self.config:
+            return int(self.config["ocr_max_dpi"] or 0)
+        return int(os.getenv("OCR_MAX_DPI", "300"))
+    
+    def _qty_ship_groups(self) -> tuple:
+        """Quantity-shipped candidates to try; the bare-number fallback also
+        matches page numbers and years, so it is opt-in"""
+        if "aggressive_qty_match" in self.config:
+            aggressive = bool(self.config["aggressive_qty_match"])
+        else:
+            aggressive = os.getenv("AGGRESSIVE_QTY_MATCH", "false").lower() == "true"
+        return _QTY_SHIP_GROUPS if aggressive else _QTY_SHIP_GROUPS[:-1]
+    
     def _extract_vendor(self, results: Dict[str, Any]) -> str:
         """Extract vendor information from text"""
         for page in results["pages"]:
             text = page.get("text", "")
-            import re
             # Look for vendor address section - improved pattern
-            vendor_match = re.search(r"Vendor address[^\n]*\n([^\n]+)", text, re.IGNORECASE)
+            vendor_match = _VENDOR_ADDRESS_RE.search(text)
             if vendor_match:
                 vendor_name = vendor_match.group(1).strip()
                 # Clean up common artifacts
-                if vendor_name and not re.match(r'^\d+\s', vendor_name):
+                if vendor_name and not _LEADING_NUMBER_RE.match(vendor_name):
                     return vendor_name
             
             # Fallback: Look for company names with common suffixes
-            company_match = re.search(r"([A-Z][A-Z\s,\.&]+(?:INC|LLC|CORP|COMPANY|CO|ENTERPRISES)[A-Z\s,\.]*)", text, re.IGNORECASE)
+            company_match = _COMPANY_NAME_RE.search(text)
             if company_match:
                 return company_match.group(1).strip()
         return ""
     
-    def _extract_date(self, results: Dict[str, Any]) -> str:
-        """Extract date from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for date patterns
-            date_match = re.search(r"Date[:\s]*(\d{1,2}[/\-]\d{1,2}[/\-]\d{4})", text, re.IGNORECASE)
-            if date_match:
-                return date_match.group(1)
-        return ""
-    
-    def _extract_amount(self, results: Dict[str, Any]) -> str:
-        """Extract total amount from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for Total amount or Net value
-            amount_patterns = [
-                r"Total amount[:\s]*([\d,]+\.?\d*)",
-                r"Net value[:\s]*([\d,]+\.?\d*)",
-                r"amount[:\s]*\$?([\d,]+\.?\d*)",
-                r"\$[\s]*([\d,]+\.?\d*)"
-            ]
-            
-            for pattern in amount_patterns:
-                amount_match = re.search(pattern, text, re.IGNORECASE)
-                if amount_match:
-                    return amount_match.group(1)
-        return ""
-    
-    def _extract_delivery_date(self, results: Dict[str, Any]) -> str:
-        """Extract delivery date from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for delivery date patterns - improved
-            delivery_match = re.search(r"Delivery Date[^\n]*\n[^\n]*?(\d{1,2}/\d{1,2}/\d{4})", text, re.IGNORECASE | re.DOTALL)
-            if delivery_match:
-                return delivery_match.group(1)
-                
-            # Look for dock date patterns
-            dock_match = re.search(r"Dockdate[:\s]*(\d{1,2}/\d{1,2}/\d{4})", text, re.IGNORECASE)
-            if dock_match:
-                return dock_match.group(1)
-                
-            # Look for date after EA
-            ea_date_match = re.search(r"EA[^\n]*?(\d{1,2}/\d{1,2}/\d{4})", text, re.IGNORECASE)
-            if ea_date_match:
-                return ea_date_match.group(1)
-        return ""
-    
-    def _extract_vendor_number(self, results: Dict[str, Any]) -> str:
-        """Extract vendor number from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            vendor_num_match = re.search(r"Vendor number[:\s]*(\d+)", text, re.IGNORECASE)
-            if vendor_num_match:
-                return vendor_num_match.group(1)
-        return ""
-    
-    def _extract_buyer_name(self, results: Dict[str, Any]) -> str:
-        """Extract buyer name from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            buyer_match = re.search(r"Buyer/phone[:\s]*([^/]+)", text, re.IGNORECASE)
-            if buyer_match:
-                return buyer_match.group(1).strip()
-        return ""
-    
-    def _extract_buyer_phone(self, results: Dict[str, Any]) -> str:
-        """Extract buyer phone from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            phone_match = re.search(r"Buyer/phone[:\s]*[^/]+/\s*(\d{3}-\d{3}-\d{4})", text, re.IGNORECASE)
-            if phone_match:
-                return phone_match.group(1)
-        return ""
-    
-    def _extract_buyer_email(self, results: Dict[str, Any]) -> str:
-        """Extract buyer email from text"""
+    def _scan_all(self, results: Dict[str, Any]) -> Dict[str, str]:
+        """Resolve the keyword-anchored fields with one regex scan per page.
+
+        Fields keep their previous precedence: the first page with a hit
+        wins, and within a page Delivery Date beats Dockdate beats an EA
+        line date, and Production Order beats MJO beats a bare 9-12 digit
+        number that is not a PO number.
+        """
+        fields = {}
+        qty_groups = self._qty_ship_groups()
         for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            email_match = re.search(r"Buyer E-mail[:\s]*([^\s]+@[^\s]+)", text, re.IGNORECASE)
-            if email_match:
-                return email_match.group(1)
-        return ""
-    
+            hits = _scan_page_fields(page.get("text", ""))
+
+            for name in ("date", "vendor_number", "buyer_phone", "buyer_email"):
+                if name not in fields and name in hits:
+                    fields[name] = hits[name]
+            if "buyer_name" not in fields and "buyer_name" in hits:
+                fields["buyer_name"] = hits["buyer_name"].strip()
+
+            if "delivery_date" not in fields:
+                delivery = hits.get("delivery_date") or hits.get("dock_date") or hits.get("ea_date")
+                if delivery:
+                    fields["delivery_date"] = delivery
+
+            if "production_order" not in fields:
+                production_order = hits.get("production_order") or hits.get("mjo")
+                if not production_order and not hits.get("long_number", "45").startswith('45'):
+                    production_order = hits["long_number"]
+                if production_order:
+                    fields["production_order"] = production_order
+
+            # Amount: Total amount beats Net value beats any "amount" beats a bare $ figure
+            if "amount" not in fields:
+                amount = (hits.get("amount_total") or hits.get("amount_net")
+                          or hits.get("amount_any") or hits.get("amount_dollar"))
+                if amount:
+                    fields["amount"] = amount
+
+            if "quantity_shipped" not in fields:
+                for name in qty_groups:
+                    if name in hits:
+                        try:
+                            # Convert to whole number
+                            fields["quantity_shipped"] = str(int(float(hits[name])))
+                            break
+                        except ValueError:
+                            continue
+
+            # Payment Terms - flag if not '30 Days'
+            if "payment_terms" not in fields and "payment_terms" in hits:
+                terms = hits["payment_terms"].strip()
+                if "30 Days" not in terms:
+                    fields["payment_terms"] = f"NON_STANDARD: {terms}"
+                else:
+                    fields["payment_terms"] = "STANDARD: 30 Days"
+
+            if len(fields) == len(_SCANNED_FIELDS):
+                break
+        return fields
+
+    def _combined_text(self, results: Dict[str, Any]) -> str:
+        """All page text joined with page-break markers, built once per PDF.
+
+        Extractors whose first match doesn't depend on page boundaries scan
+        this single string instead of re-walking results["pages"].
+        """
+        combined = results.get("_combined_text")
+        if combined is None:
+            combined = _PAGE_BREAK.join(page.get("text", "") for page in results["pages"])
+            results["_combined_text"] = combined
+        return combined
+
     def _extract_part_number(self, results: Dict[str, Any]) -> str:
         """Extract part number from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for part number pattern
-            part_match = re.search(r"(\d{6}-\d+[A-Z]*)", text)
-            if part_match:
-                return part_match.group(1)
+        # Look for part number pattern
+        part_match = _PART_NUMBER_RE.search(self._combined_text(results))
+        if part_match:
+            return part_match.group(1)
         return ""
     
     def _extract_quantity(self, results: Dict[str, Any]) -> str:
         """Extract quantity from text"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for quantity in delivery section
-            qty_match = re.search(r"Quantity[:\s]*(\d+\.?\d*)", text, re.IGNORECASE)
-            if qty_match:
-                return qty_match.group(1)
+        # Look for quantity in delivery section
+        qty_match = _QUANTITY_RE.search(self._combined_text(results))
+        if qty_match:
+            return qty_match.group(1)
         return ""
     
     def _extract_net_per_price(self, results: Dict[str, Any]) -> str:
         """Extract net per price from text"""
         for page in results["pages"]:
             text = page.get("text", "")
-            import re
             # Look for net per price
-            price_match = re.search(r"Net Per[:\s]*UM[:\s]*Dockdate[:\s]*Net[:\s]*.*?(\d+,\d+\.\d+)", text, re.IGNORECASE | re.DOTALL)
+            price_match = _NET_PER_PRICE_RE.search(text)
             if price_match:
                 return price_match.group(1)
         return ""
@@ -480,94 +1352,27 @@ class UnifiedOCRPipeline:
     # FileMaker-specific extraction functions
     def _extract_po_number(self, results: Dict[str, Any]) -> str:
         """Extract PO Number for Whittaker Shipper field (must be 10 digits starting with 45)"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for PO number pattern: 10 digits starting with 45
-            po_match = re.search(r"(45\d{8})", text)
-            if po_match:
-                po_number = po_match.group(1)
-                if len(po_number) == 10 and po_number.startswith('45'):
-                    return po_number
-        return ""
-    
-    def _extract_production_order(self, results: Dict[str, Any]) -> str:
-        """Extract Production Order for MJO NO field"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for Production Order pattern - extract number only
-            prod_order_match = re.search(r"Production Order[:\s]*(\d+)", text, re.IGNORECASE)
-            if prod_order_match:
-                return prod_order_match.group(1)  # Return only the number
-            
-            # Alternative pattern: look for MJO or similar
-            mjo_match = re.search(r"MJO[:\s#]*(\d+)", text, re.IGNORECASE)
-            if mjo_match:
-                return mjo_match.group(1)
-                
-            # Look for standalone production order numbers
-            po_num_match = re.search(r"(\d{9,12})", text)  # 9-12 digit numbers
-            if po_num_match:
-                num = po_num_match.group(1)
-                # Make sure it's not a PO number (which starts with 45)
-                if not num.startswith('45'):
-                    return num
-        return ""
-    
-    def _extract_quantity_shipped(self, results: Dict[str, Any]) -> str:
-        """Extract Quantity Shipped for QTY SHIP field (number near EA line)"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            
-            # Multiple patterns to find quantity shipped
-            patterns = [
-                # Pattern 1: Delivery Date section with quantity
-                r"Delivery Date[^\n]*\n[^\n]*Quantity[^\n]*\n[^\n]*?(\d+\.?\d*)",
-                # Pattern 2: QTY followed by number
-                r"QTY[:\s]*(\d+\.?\d*)",
-                # Pattern 3: Quantity followed by number
-                r"Quantity[:\s]*(\d+\.?\d*)",
-                # Pattern 4: Number followed by EA (each)
-                r"(\d+\.?\d*)\s*EA",
-                # Pattern 5: Ship Qty
-                r"Ship\s*Qty[:\s]*(\d+\.?\d*)",
-                # Pattern 6: Shipped quantity
-                r"Shipped[:\s]*(\d+\.?\d*)",
-                # Pattern 7: Look for number before "EACH" or "EA"
-                r"(\d+\.?\d*)\s*(?:EACH|EA)\b",
-                # Pattern 8: Delivery quantity
-                r"Delivery[^\n]*?(\d+\.?\d*)",
-                # Pattern 9: Any standalone number that could be quantity (last resort)
-                r"\b(\d{1,4})\b(?!\d)"  # 1-4 digits not followed by more digits
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
-                if match:
-                    qty = match.group(1)
-                    try:
-                        # Convert to whole number
-                        return str(int(float(qty)))
-                    except ValueError:
-                        continue
+        # Look for PO number pattern: 10 digits starting with 45
+        po_match = _PO_NUMBER_RE.search(self._combined_text(results))
+        if po_match:
+            po_number = po_match.group(1)
+            if len(po_number) == 10 and po_number.startswith('45'):
+                return po_number
         return ""
     
     def _extract_part_number_with_op(self, results: Dict[str, Any]) -> str:
         """Extract Part Number with OP## in format like 150219*OP20"""
         for page in results["pages"]:
             text = page.get("text", "")
-            import re
             # Look for part number pattern in the text - improved pattern
-            part_match = re.search(r"(\d{6}-?\d*[A-Z]*)\s+(OP\d+)", text, re.IGNORECASE)
+            part_match = _PART_WITH_OP_RE.search(text)
             if part_match:
                 part_base = part_match.group(1)
                 op_code = part_match.group(2).upper()
                 return f"{part_base}*{op_code}"
             
             # Alternative pattern: look for part numbers near "ASSEMBLY" or "BODY ASSY"
-            assembly_match = re.search(r"(\d{6}-?\d*[A-Z]*)\s+(\w+\d+)\s+(?:ASSEMBLY|BODY ASSY)", text, re.IGNORECASE)
+            assembly_match = _PART_ASSEMBLY_RE.search(text)
             if assembly_match:
                 part_base = assembly_match.group(1)
                 op_code = assembly_match.group(2).upper()
@@ -580,215 +1385,344 @@ class UnifiedOCRPipeline:
         if not part_number:
             return ""
         
-        import re
         # If it already has asterisk, return as is
         if '*' in part_number:
             return part_number
             
         # Convert dash-OP format to asterisk-OP format
-        formatted = re.sub(r'-OP(\d+)$', r'*OP\1', part_number)
+        formatted = _DASH_OP_SUFFIX_RE.sub(r'*OP\1', part_number)
         return formatted
     
     def _extract_dpas_rating(self, results: Dict[str, Any]) -> str:
         """Extract DPAS Rating (can appear multiple times, save last or all)"""
-        dpas_ratings = []
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for DPAS rating patterns
-            dpas_matches = re.findall(r"DPAS[:\s]*([A-Z]\d+)", text, re.IGNORECASE)
-            dpas_ratings.extend(dpas_matches)
+        if "dpas_last_only" in self.config:
+            last_only = bool(self.config["dpas_last_only"])
+        else:
+            last_only = os.getenv("DPAS_LAST_ONLY", "false").lower() == "true"
+        if last_only:
+            # Only the final rating is wanted: walk back from the last page
+            # and stop at the first page that has one
+            for page in reversed(results["pages"]):
+                dpas_ratings = _DPAS_RE.findall(page.get("text", ""))
+                if dpas_ratings:
+                    return dpas_ratings[-1]
+            return ""
+
+        # Look for DPAS rating patterns
+        dpas_ratings = _DPAS_RE.findall(self._combined_text(results))
         
         if dpas_ratings:
             # Return all ratings joined with comma, or just the last one
             return ", ".join(dpas_ratings) if len(dpas_ratings) > 1 else dpas_ratings[0]
         return ""
     
-    def _check_payment_terms(self, results: Dict[str, Any]) -> str:
-        """Check Payment Terms - flag if not '30 Days'"""
-        for page in results["pages"]:
-            text = page.get("text", "")
-            import re
-            # Look for payment terms
-            payment_match = re.search(r"Payment terms[:\s]*([^\\n]+)", text, re.IGNORECASE)
-            if payment_match:
-                terms = payment_match.group(1).strip()
-                if "30 Days" not in terms:
-                    return f"NON_STANDARD: {terms}"
-                else:
-                    return "STANDARD: 30 Days"
-        return ""
-    
     def _extract_quality_clauses(self, results: Dict[str, Any]) -> dict:
         """Extract Quality Clauses (Q# codes) for Notes JSON"""
         quality_clauses = {}
         for page in results["pages"]:
             text = page.get("text", "")
-            import re
+            # Both patterns need a literal Q/q; most pages have none
+            if "Q" not in text and "q" not in text:
+                continue
             # Look for Q# patterns with better text capture
-            q_matches = re.findall(r"(Q\d+)\s+([A-Z][A-Z\s,\[\]()]+?)(?=\s*Q\d+|\s*$|\n\n)", text, re.IGNORECASE | re.DOTALL)
+            q_matches = _QUALITY_CLAUSE_RE.findall(text)
             for q_code, description in q_matches:
                 # Clean up the description
                 clean_desc = ' '.join(description.strip().split())
                 quality_clauses[q_code.upper()] = clean_desc[:100]  # Limit length
                 
             # Also look for standalone Q# codes with descriptions on next lines
-            standalone_matches = re.findall(r"(Q\d+)\s*([A-Z][A-Z\s,\[\]()]{10,50})", text, re.IGNORECASE)
+            standalone_matches = _QUALITY_CLAUSE_STANDALONE_RE.findall(text)
             for q_code, description in standalone_matches:
                 if q_code.upper() not in quality_clauses:
                     clean_desc = ' '.join(description.strip().split())
                     quality_clauses[q_code.upper()] = clean_desc[:100]
         return quality_clauses
     
-    def _enhance_image_for_ocr(self, image_path: str) -> str:
-        """Enhanced image preprocessing for better OCR results"""
+    def _preprocess_ocr_image(self, image):
+        """Apply the preprocessing selected by config["ocr_preprocess"].
+
+        True (default) runs the full enhancement chain, "fast" the
+        grayscale + Otsu + dilation recipe, False leaves the image as is.
+        """
+        mode = self.config.get("ocr_preprocess", True)
+        if mode == "fast":
+            try:
+                return _preprocess_for_ocr(image)
+            except Exception as e:
+                self.logger.warning(f"Fast OCR preprocessing failed: {e}, using original")
+                return image
+        if mode:
+            # ENHANCED IMAGE PREPROCESSING
+            return self._enhance_image_for_ocr(image)
+        return image
+
+    def _enhance_image_for_ocr(self, image):
+        """Enhanced image preprocessing for better OCR results.
+
+        Contrast and sharpness are the ImageEnhance formulas expressed as
+        OpenCV ops on one uint8 array, so PIL is only touched on the way in
+        and out.
+        """
         try:
-            from PIL import Image, ImageEnhance, ImageFilter
+            from PIL import Image
             import cv2
             import numpy as np
             
-            # Load image
-            pil_image = Image.open(image_path)
-            
             # Convert to grayscale if not already
-            if pil_image.mode != 'L':
-                pil_image = pil_image.convert('L')
-            
-            # Convert to OpenCV format properly
-            cv_image = np.array(pil_image)
-            
-            # Ensure single channel grayscale
-            if len(cv_image.shape) == 3:
-                cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2GRAY)
+            if image.mode != 'L':
+                gray = np.asarray(image.convert('L'))
+            else:
+                gray = np.asarray(image)
             
             # 1. Increase contrast and sharpness
-            enhanced_image = Image.fromarray(cv_image)
-            
-            # Contrast enhancement
-            contrast_enhancer = ImageEnhance.Contrast(enhanced_image)
-            enhanced_image = contrast_enhancer.enhance(1.5)  # 50% more contrast
+            # Contrast 1.5x around the mean grey (ImageEnhance.Contrast(1.5))
+            mean = int(gray.mean() + 0.5)
+            enhanced = cv2.addWeighted(gray, 1.5, gray, 0.0, -0.5 * mean)
             
-            # Sharpness enhancement
-            sharpness_enhancer = ImageEnhance.Sharpness(enhanced_image)
-            enhanced_image = sharpness_enhancer.enhance(2.0)  # 2x sharpness
-            
-            # Convert back to OpenCV for denoising
-            cv_enhanced = np.array(enhanced_image)
+            # Sharpness 2x: 2*image - SMOOTH(image) (ImageEnhance.Sharpness(2.0))
+            kernel = np.array(_SHARPEN_2X_KERNEL_ROWS, dtype=np.float32)
+            enhanced = cv2.filter2D(enhanced, -1, kernel,
+                                    borderType=cv2.BORDER_REPLICATE)
             
             # 2. Noise reduction
-            denoised = cv2.fastNlMeansDenoising(cv_enhanced)
+            denoised = cv2.fastNlMeansDenoising(enhanced)
             
             # 3. Adaptive thresholding for better text detection
             adaptive_thresh = cv2.adaptiveThreshold(
                 denoised, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
             )
             
-            # 4. Morphological operations to clean up text
-            kernel = np.ones((1, 1), np.uint8)
-            cleaned = cv2.morphologyEx(adaptive_thresh, cv2.MORPH_CLOSE, kernel)
-            
-            # Save enhanced image
-            enhanced_path = image_path.replace('.png', '_enhanced.png')
-            cv2.imwrite(enhanced_path, cleaned)
-            
-            self.logger.info(f"Enhanced image saved: {enhanced_path}")
-            return enhanced_path
+            # Already two-level; 1bpp lets Tesseract skip its own thresholding
+            return Image.fromarray(adaptive_thresh).convert("1", dither=Image.Dither.NONE)
             
         except Exception as e:
             self.logger.warning(f"Image enhancement failed: {e}, using original")
-            return image_path
+            return image
     
-    def _run_enhanced_ocr(self, image_path: str, page_num: int) -> tuple:
-        """Run OCR with enhanced settings and confidence scoring"""
+    def _get_tesserocr_api(self, mode: str):
+        """Return a persistent tesserocr API for mode "block" or "auto".
+
+        "block" mirrors the pytesseract --psm 6 whitelist config, "auto" the
+        --psm 3 fallback. Each API loads the language model once and is
+        reused for every page; returns None when tesserocr is unavailable.
+        """
+        if mode in self._tess_apis:
+            return self._tess_apis[mode]
+
+        api = None
         try:
-            import pytesseract
-            from PIL import Image
-            
-            # Enhanced OCR configuration
-            custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,/:-()\\ '
-            
-            # Run OCR with data output for confidence
-            ocr_data = pytesseract.image_to_data(
-                Image.open(image_path), 
-                config=custom_config,
-                output_type=pytesseract.Output.DICT
-            )
-            
-            # Extract text and calculate confidence
+            import tesserocr
+
+            path_kwargs = {"path": self._tessdata_dir} if self._tessdata_dir else {}
+            if mode == "block":
+                api = tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.SINGLE_BLOCK,
+                                              oem=tesserocr.OEM.DEFAULT, **path_kwargs)
+                api.SetVariable("tessedit_char_whitelist", _OCR_CHAR_WHITELIST)
+                api.SetVariable("tessedit_do_invert", "0")
+            else:
+                api = tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.AUTO,
+                                              oem=tesserocr.OEM.DEFAULT, **path_kwargs)
+        except ImportError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"⚠️  tesserocr init failed, using pytesseract: {e}")
+
+        self._tess_apis[mode] = api
+        return api
+
+    def _ocr_words(self, image) -> tuple:
+        """OCR an image into (words, confidences) with the block-mode config"""
+        api = self._get_tesserocr_api("block")
+        if api is not None:
+            import tesserocr
+
+            api.SetImage(image)
+            api.Recognize()
+            level = tesserocr.RIL.WORD
             words = []
             confidences = []
-            
-            for i, word in enumerate(ocr_data['text']):
-                if word.strip():  # Only non-empty words
-                    confidence = ocr_data['conf'][i]
-                    if confidence > 30:  # Only words with >30% confidence
-                        words.append(word)
-                        confidences.append(confidence)
-            
-            ocr_text = ' '.join(words)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-            
-            # Fallback: try different PSM modes if confidence is low
-            if avg_confidence < 50:
-                self.logger.info(f"Low confidence ({avg_confidence:.1f}%), trying PSM mode 3")
-                fallback_config = r'--oem 3 --psm 3'
-                ocr_text_fallback = pytesseract.image_to_string(
-                    Image.open(image_path), 
-                    config=fallback_config,
-                    lang="eng"
-                )
-                if len(ocr_text_fallback.strip()) > len(ocr_text.strip()):
-                    ocr_text = ocr_text_fallback
-                    avg_confidence = 60  # Estimated confidence for fallback
-            
-            return ocr_text, avg_confidence
+            for item in tesserocr.iterate_level(api.GetIterator(), level):
+                words.append(item.GetUTF8Text(level) or "")
+                confidences.append(item.Confidence(level))
+            return words, confidences
+
+        import pytesseract
+
+        # Run OCR with data output for confidence
+        ocr_data = pytesseract.image_to_data(
+            image,
+            config=self._tesseract_config(_TESSERACT_BLOCK_CONFIG),
+            output_type=pytesseract.Output.DICT
+        )
+        return ocr_data['text'], ocr_data['conf']
+
+    def _ocr_text_auto(self, image) -> str:
+        """OCR an image with automatic page segmentation (--psm 3)"""
+        api = self._get_tesserocr_api("auto")
+        if api is not None:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+        import pytesseract
+        return pytesseract.image_to_string(image, config=self._tesseract_config(_TESSERACT_AUTO_CONFIG), lang="eng")
+
+    def _get_page_pool(self, workers: int):
+        """Page-analysis pool kept alive across PDFs.
+
+        Starting workers (interpreter, imports, OCR engine) costs more than
+        analyzing a short PDF, so the pool is sized from the configured
+        worker count rather than each PDF's page count and is only rebuilt
+        when that setting changes.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self._page_pool is None or self._page_pool_workers != workers:
+            self._shutdown_page_pool()
+            self._page_pool = ProcessPoolExecutor(max_workers=workers,
+                                                  mp_context=_pool_context(),
+                                                  initializer=_init_page_worker,
+                                                  initargs=(self.config,))
+            self._page_pool_workers = workers
+        return self._page_pool
+
+    def _shutdown_page_pool(self):
+        if self._page_pool is not None:
+            self._page_pool.shutdown(wait=True)
+            self._page_pool = None
+            self._page_pool_workers = 0
+
+    def close(self):
+        """Release persistent OCR engine handles and page workers"""
+        self._shutdown_page_pool()
+        for api in self._tess_apis.values():
+            if api is not None:
+                api.End()
+        self._tess_apis.clear()
+
+    def _score_ocr_words(self, image, words, confidences, page_num: int) -> tuple:
+        """Turn block-mode OCR words into (text, confidence), retrying with
+        automatic page segmentation when the confidence is low"""
+        kept_words = []
+        kept_confidences = []
+        
+        # Only non-empty words with >30% confidence; the numeric test goes
+        # first so Tesseract's -1 layout rows are dropped without a strip()
+        for word, confidence in zip(words, confidences):
+            if confidence > 30 and word.strip():
+                kept_words.append(word)
+                kept_confidences.append(confidence)
+        
+        ocr_text = ' '.join(kept_words)
+        avg_confidence = sum(kept_confidences) / len(kept_confidences) if kept_confidences else 0
+        
+        # Fallback: try different PSM modes if confidence is low
+        if avg_confidence < 50:
+            self.logger.info(f"Low confidence ({avg_confidence:.1f}%), trying PSM mode 3")
+            ocr_text_fallback = self._ocr_text_auto(image)
+            if len(ocr_text_fallback.strip()) > len(ocr_text.strip()):
+                ocr_text = ocr_text_fallback
+                avg_confidence = 60  # Estimated confidence for fallback
+        
+        return ocr_text, avg_confidence
+
+    def _run_enhanced_ocr(self, image, page_num: int) -> tuple:
+        """Run OCR with enhanced settings and confidence scoring"""
+        try:
+            if self._get_tesserocr_api("block") is None:
+                # pytesseract re-encodes a PIL image to a temp PNG on every
+                # call; encode it once so the low-confidence PSM 3 retry
+                # reads the same file
+                import tempfile
+
+                with tempfile.TemporaryDirectory(prefix="ocr_page_") as tmp_dir:
+                    image_path = os.path.join(tmp_dir, "page.png")
+                    image.save(image_path)
+                    words, confidences = self._ocr_words(image_path)
+                    return self._score_ocr_words(image_path, words, confidences, page_num)
+
+            words, confidences = self._ocr_words(image)
+            return self._score_ocr_words(image, words, confidences, page_num)
             
         except Exception as e:
             self.logger.error(f"Enhanced OCR failed for page {page_num}: {e}")
             # Fallback to basic OCR
             import pytesseract
-            from PIL import Image
-            basic_text = pytesseract.image_to_string(Image.open(image_path), lang="eng")
-            return basic_text, 50  # Default confidence
+            basic_text = pytesseract.image_to_string(image, lang="eng")
+            return _FallbackOCRResult((basic_text, 50))  # Default confidence
+
+    def _run_enhanced_ocr_batch(self, images: List[Any], page_numbers: List[int]) -> List[tuple]:
+        """Block-mode OCR for several images with one tesseract process.
+
+        The images are written to a temporary directory and listed in a text
+        file, which tesseract accepts as a multi-page input; the TSV output's
+        page_num column maps words back to their image. Falls back to
+        per-image OCR if the batch run fails.
+        """
+        import pytesseract
+        import tempfile
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="ocr_batch_") as tmp_dir:
+                image_paths = []
+                for index, image in enumerate(images):
+                    image_path = os.path.join(tmp_dir, f"page_{index + 1:03d}.png")
+                    image.save(image_path)
+                    image_paths.append(image_path)
+                list_path = os.path.join(tmp_dir, "ocr_batch.txt")
+                with open(list_path, "w", encoding="utf-8") as f:
+                    f.write("\n".join(image_paths) + "\n")
+
+                ocr_data = pytesseract.image_to_data(
+                    list_path,
+                    config=self._tesseract_config(_TESSERACT_BLOCK_CONFIG),
+                    output_type=pytesseract.Output.DICT
+                )
+        except Exception as e:
+            self.logger.warning(f"Batch OCR failed, falling back to per-page OCR: {e}")
+            return [self._run_enhanced_ocr(image, page_num)
+                    for image, page_num in zip(images, page_numbers)]
+
+        page_words: List[List[str]] = [[] for _ in images]
+        page_confidences: List[List[float]] = [[] for _ in images]
+        for batch_page, word, confidence in zip(ocr_data['page_num'], ocr_data['text'], ocr_data['conf']):
+            page_words[batch_page - 1].append(word)
+            page_confidences[batch_page - 1].append(confidence)
+
+        self.logger.info(f"Batch OCR processed {len(images)} pages in one tesseract run")
+        return [self._score_ocr_words(image, words, confidences, page_num)
+                for image, words, confidences, page_num
+                in zip(images, page_words, page_confidences, page_numbers)]
     
     def _validate_po_number(self, po_number: str, full_text: str) -> bool:
         """Validate PO number against common OCR errors"""
         try:
-            # Check if PO appears multiple times in text (consistency check)
-            import re
-            po_occurrences = len(re.findall(po_number, full_text))
+            # Structural check first: a PO number is all digits starting
+            # with 45, and anything else needs no text scan at all
+            if not (po_number.startswith('45') and po_number.isdigit()):
+                return False
+            
+            # Check if PO appears multiple times in text (consistency check).
+            # PO numbers are plain digits, so a substring count matches what
+            # re.findall returned without compiling a pattern per candidate.
+            po_occurrences = full_text.count(po_number)
             
             # If PO appears multiple times, it's more likely correct
             if po_occurrences >= 2:
                 return True
             
-            # Check for common OCR digit confusions
-            # 5 vs 6, 3 vs 8, 0 vs 8, 1 vs 7, etc.
-            common_errors = {
-                '5': '6', '6': '5',
-                '3': '8', '8': '3', 
-                '0': '8', '8': '0',
-                '1': '7', '7': '1'
-            }
-            
             # Generate alternative PO numbers based on common OCR errors
-            for pos in range(len(po_number)):
-                original_digit = po_number[pos]
-                if original_digit in common_errors:
-                    alternative_digit = common_errors[original_digit]
+            for pos, original_digit in enumerate(po_number):
+                for alternative_digit in _OCR_DIGIT_CONFUSIONS.get(original_digit, ()):
                     alternative_po = po_number[:pos] + alternative_digit + po_number[pos+1:]
                     
                     # Check if alternative appears more frequently in text
-                    alt_occurrences = len(re.findall(alternative_po, full_text))
+                    alt_occurrences = full_text.count(alternative_po)
                     if alt_occurrences > po_occurrences:
                         self.logger.info(f"OCR correction suggested: {po_number} → {alternative_po}")
                         return False  # Reject this PO, original might be wrong
             
-            # Additional validation: should be reasonable PO number
-            if po_number.startswith('45') and po_number.isdigit():
-                return True
-                
-            return False
+            return True
             
         except Exception as e:
             self.logger.warning(f"PO validation error: {e}")
@@ -800,12 +1734,14 @@ class UnifiedOCRPipeline:
             return "FAILED"
         
         text_length = len(text.strip())
-        word_count = len(text.split())
         
-        # Calculate quality metrics
-        has_po_indicators = any(keyword in text.lower() for keyword in 
-                              ['purchase order', 'po', 'meggitt', 'vendor', 'date'])
-        has_numbers = any(char.isdigit() for char in text)
+        # Calculate quality metrics (lower-case the text once, not per keyword)
+        lowered = text.lower()
+        has_po_indicators = any(keyword in lowered for keyword in _OCR_PO_INDICATORS)
+        # \d finds ASCII/decimal digits in C; only non-ASCII text can hold the
+        # extra isdigit() characters (superscripts etc.) it misses
+        has_numbers = (_DIGIT_RE.search(text) is not None
+                       or (not text.isascii() and any(char.isdigit() for char in text)))
         has_meaningful_length = text_length > 50
         
         # Quality scoring
@@ -823,7 +1759,7 @@ class UnifiedOCRPipeline:
     def _extract_filemaker_data_with_ai(self, results: Dict[str, Any], po_number: str) -> Dict[str, Any]:
         """Use Ollama AI to extract FileMaker data from PDF text with OCR quality validation"""
         # Combine text from first 2 pages (PO pages) with quality assessment
-        combined_text = ""
+        text_parts = []
         overall_quality = "UNKNOWN"
         quality_scores = []
         
@@ -833,7 +1769,7 @@ class UnifiedOCRPipeline:
             confidence = page.get("ocr_confidence", 0)
             
             if text:
-                combined_text += f"\n--- PAGE {page['page_number']} (Quality: {page_quality}, Confidence: {confidence:.1f}%) ---\n{text}"
+                text_parts.append(f"\n--- PAGE {page['page_number']} (Quality: {page_quality}, Confidence: {confidence:.1f}%) ---\n{text}")
                 
                 # Track quality for decision making
                 if page_quality in ["EXCELLENT", "GOOD"]:
@@ -843,6 +1779,8 @@ class UnifiedOCRPipeline:
                 else:
                     quality_scores.append(0)
         
+        combined_text = "".join(text_parts)
+        
         # Determine overall OCR quality
         if quality_scores:
             avg_quality = sum(quality_scores) / len(quality_scores)
@@ -855,26 +1793,43 @@ class UnifiedOCRPipeline:
         
         self.logger.info(f"OCR Quality Assessment: {overall_quality}")
         
+        # Regex extraction is cheap, so run it first and only pay for an
+        # Ollama round-trip when it leaves too many required fields empty
+        regex_data = self._fallback_regex_extraction(results, po_number)
+
         if not combined_text.strip():
             self.logger.warning("No text available for AI extraction")
-            return self._fallback_regex_extraction(results, po_number)
+            return regex_data
 
         # Skip AI processing if OCR quality is too poor
         if overall_quality == "LOW":
             self.logger.warning("OCR quality too low for reliable AI processing, using regex fallback")
-            return self._fallback_regex_extraction(results, po_number)
+            return regex_data
+
+        filled = sum(1 for field in _REQUIRED_FILEMAKER_FIELDS if regex_data.get(field))
+        min_fields = int(os.getenv("OLLAMA_SKIP_MIN_FIELDS", "4"))
+        if min_fields > 0 and filled >= min_fields:
+            self.logger.info(f"📝 Regex filled {filled}/{len(_REQUIRED_FILEMAKER_FIELDS)} required fields, skipping Ollama")
+            return regex_data
 
         # Cap text length to avoid model/context crashes
         max_chars = int(os.getenv("OLLAMA_MAX_CHARS", "6000"))
         if len(combined_text) > max_chars:
             self.logger.info(f"Truncating AI input text from {len(combined_text)} to {max_chars} chars")
             combined_text = combined_text[:max_chars]
+
+        cache_path = self._ollama_cache_path(po_number, combined_text)
+        cached = _load_json_cache(cache_path)
+        if cached:
+            self.logger.info("✅ Used cached Ollama AI extraction")
+            return self._format_ai_data_for_filemaker(cached)
         
         # Try Ollama first, fallback to regex if not available
         try:
             ai_extracted = self._query_ollama_for_extraction(combined_text, po_number, overall_quality)
             if ai_extracted:
                 self.logger.info("✅ Used Ollama AI for data extraction")
+                self._store_cached_extraction(cache_path, ai_extracted)
                 # Post-process AI-extracted data for FileMaker formatting
                 return self._format_ai_data_for_filemaker(ai_extracted)
         except Exception as e:
@@ -882,7 +1837,99 @@ class UnifiedOCRPipeline:
         
         # Fallback to regex extraction
         self.logger.info("📝 Using regex fallback for data extraction")
-        return self._fallback_regex_extraction(results, po_number)
+        return regex_data
+
+    def _ollama_cache_path(self, po_number: str, combined_text: str) -> Optional[Path]:
+        """Cache file for an Ollama response, keyed by model, PO number and input text"""
+        cache_dir = os.getenv("OLLAMA_CACHE_DIR", os.path.join(os.getenv("LOG_DIR", "/app/logs"), "ollama_cache"))
+        if not cache_dir:
+            return None
+        import hashlib
+
+        model = os.getenv("OLLAMA_MODEL", "llama3.2:1b")
+        digest = hashlib.sha256(f"{model}\0{po_number}\0{combined_text}".encode("utf-8")).hexdigest()
+        return Path(cache_dir) / f"{digest}.json"
+
+    def _store_cached_extraction(self, cache_path: Optional[Path], ai_data: Dict[str, Any]) -> None:
+        """Persist an Ollama response so reruns of the same PDF skip the model"""
+        if cache_path is None:
+            return
+        try:
+            _store_json_cache(cache_path, ai_data, "OLLAMA_CACHE_MAX_ENTRIES")
+        except OSError as e:
+            self.logger.debug(f"Could not write Ollama cache {cache_path}: {e}")
+
+    def _ocr_engine_signature(self) -> bytes:
+        """Everything besides the pixels that decides what OCR returns: the
+        engine and its version, the model files and the tesseract configs.
+
+        Computed once per pipeline; the pytesseract version check runs the
+        tesseract binary.
+        """
+        if self._ocr_cache_key_prefix is None:
+            if self._get_tesserocr_api("block") is not None:
+                import tesserocr
+
+                engine = f"tesserocr {tesserocr.tesseract_version()}"
+            else:
+                import pytesseract
+
+                engine = f"pytesseract {pytesseract.get_tesseract_version()}"
+            tessdata_dir = self._tessdata_dir or os.getenv("TESSDATA_PREFIX", "")
+            traineddata = ""
+            if tessdata_dir:
+                try:
+                    stat = os.stat(os.path.join(tessdata_dir, "eng.traineddata"))
+                    traineddata = f"{stat.st_size}:{stat.st_mtime_ns}"
+                except OSError:
+                    pass
+            parts = (engine, self.ocr_model, tessdata_dir, traineddata,
+                     _TESSERACT_BLOCK_CONFIG, _TESSERACT_AUTO_CONFIG)
+            self._ocr_cache_key_prefix = "\0".join(parts).encode("utf-8")
+        return self._ocr_cache_key_prefix
+
+    def _ocr_cache_path(self, image) -> Optional[Path]:
+        """Cache file for a page's OCR result, keyed by the preprocessed
+        image's pixels and the engine, model and configs that read them"""
+        cache_dir = os.getenv("OCR_CACHE_DIR", os.path.join(os.getenv("LOG_DIR", "/app/logs"), "ocr_cache"))
+        if not cache_dir:
+            return None
+        import hashlib
+
+        digest = hashlib.blake2b(self._ocr_engine_signature(), digest_size=16)
+        digest.update(f"\0{image.mode}\0{image.size}\0".encode("utf-8"))
+        digest.update(image.tobytes())
+        return Path(cache_dir) / f"{digest.hexdigest()}.json"
+
+    def _cached_ocr(self, image) -> tuple:
+        """Return (cache_path, (text, confidence) or None) for a page image"""
+        try:
+            cache_path = self._ocr_cache_path(image)
+        except Exception as e:
+            self.logger.debug(f"OCR cache key failed: {e}")
+            cache_path = None
+        cached = _load_json_cache(cache_path)
+        if not cached or "text" not in cached:
+            self._ocr_cache_misses += 1
+            return cache_path, None
+        self._ocr_cache_hits += 1
+        return cache_path, (cached["text"], cached["confidence"])
+
+    def _store_cached_ocr(self, cache_path: Optional[Path], ocr_result: tuple) -> None:
+        """Persist a page's (text, confidence) so reruns skip tesseract"""
+        if cache_path is None or isinstance(ocr_result, _FallbackOCRResult):
+            return
+        ocr_text, ocr_confidence = ocr_result
+        try:
+            _store_json_cache(cache_path, {"text": ocr_text, "confidence": ocr_confidence},
+                              "OCR_CACHE_MAX_ENTRIES")
+        except OSError as e:
+            self.logger.debug(f"Could not write OCR cache {cache_path}: {e}")
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Page OCR cache hits and misses for the pages this pipeline analyzed,
+        including those handed to its page workers"""
+        return {"ocr_cache_hits": self._ocr_cache_hits, "ocr_cache_misses": self._ocr_cache_misses}
 
     def _format_ai_data_for_filemaker(self, ai_data: Dict[str, Any]) -> Dict[str, Any]:
         """Format AI-extracted data to meet FileMaker requirements"""
@@ -895,15 +1942,14 @@ class UnifiedOCRPipeline:
         
         # Format MJO_NO: extract only the number from "Production Order: 123456"
         if "MJO_NO" in ai_data and ai_data["MJO_NO"]:
-            import re
             mjo_text = str(ai_data["MJO_NO"])
             # Extract just the number from "Production Order: 123456" 
-            match = re.search(r"Production Order[:\s]*(\d+)", mjo_text, re.IGNORECASE)
+            match = _PRODUCTION_ORDER_RE.search(mjo_text)
             if match:
                 ai_data["MJO_NO"] = match.group(1)
             else:
                 # Look for standalone number pattern
-                num_match = re.search(r"(\d{8,12})", mjo_text)
+                num_match = _MJO_NUMBER_RE.search(mjo_text)
                 if num_match:
                     ai_data["MJO_NO"] = num_match.group(1)
         
@@ -920,23 +1966,23 @@ class UnifiedOCRPipeline:
     
     def _query_ollama_for_extraction(self, text: str, po_number: str, ocr_quality: str = "UNKNOWN") -> Dict[str, Any]:
         """Query Ollama to extract structured data from PO text with quality awareness"""
-        import json
         import urllib.request
         import urllib.error
         
         # Check if Ollama is available (default port 11434)
         ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
         
-        # Test connection to Ollama first
-        try:
-            test_req = urllib.request.Request(f"{ollama_url}/api/tags")
-            with urllib.request.urlopen(test_req, timeout=10) as resp:
-                if resp.status != 200:
-                    self.logger.warning(f"Ollama test connection failed with status {resp.status}")
-                    return None
-        except Exception as e:
-            self.logger.warning(f"Ollama connection test failed: {e}")
-            return None
+        # Test connection to Ollama first, unless a recent request proved it is up
+        if time.monotonic() >= self._ollama_alive_until:
+            try:
+                test_req = urllib.request.Request(f"{ollama_url}/api/tags")
+                with urllib.request.urlopen(test_req, timeout=10) as resp:
+                    if resp.status != 200:
+                        self.logger.warning(f"Ollama test connection failed with status {resp.status}")
+                        return None
+            except Exception as e:
+                self.logger.warning(f"Ollama connection test failed: {e}")
+                return None
         
         # Enhanced prompt with quality awareness
         quality_note = ""
@@ -966,6 +2012,26 @@ Text:
 Return only valid JSON with the fields above.""""""
 """
 
+        def _read_stream(resp) -> dict:
+            # Ollama streams one JSON object per line; stop reading (and let
+            # the closed connection cancel generation) as soon as the
+            # accumulated response parses as a complete JSON document.
+            buffer = []
+            for line in resp:
+                if not line.strip():
+                    continue
+                chunk = _json_loads(line)
+                buffer.append(chunk.get("response", ""))
+                if chunk.get("done"):
+                    break
+                if buffer[-1].rstrip().endswith("}"):
+                    try:
+                        _json_loads("".join(buffer))
+                        break
+                    except json.JSONDecodeError:
+                        pass
+            return {"response": "".join(buffer)}
+
         def _post_ollama(data: dict, retry_count: int = 0) -> dict:
             payload = json.dumps(data).encode("utf-8")
             req = urllib.request.Request(
@@ -976,23 +2042,31 @@ Return only valid JSON with the fields above.""""""
             )
             try:
                 with urllib.request.urlopen(req, timeout=120) as resp:  # Reduced timeout for 1B model
-                    return json.loads(resp.read().decode("utf-8"))
+                    return _read_stream(resp)
             except (urllib.error.URLError, ConnectionRefusedError) as e:
                 if retry_count < 3:
                     self.logger.warning(f"Ollama connection failed, retry {retry_count + 1}/3: {e}")
-                    import time
                     time.sleep(2)
                     return _post_ollama(data, retry_count + 1)
                 else:
                     raise e
 
+        # Greedy decoding keeps the JSON deterministic (and cacheable); the
+        # answer is a handful of short fields, so cap output and context
+        options = {
+            "temperature": 0.0,
+            "num_predict": int(os.getenv("OLLAMA_NUM_PREDICT", "256")),
+            "num_ctx": int(os.getenv("OLLAMA_NUM_CTX", "2048")),
+        }
+
         # First attempt: request structured JSON output with retry logic
         try:
             result = _post_ollama({
                 "model": os.getenv("OLLAMA_MODEL", "llama3.2:1b"),
                 "prompt": prompt,
-                "stream": False,
+                "stream": True,
                 "format": "json",
+                "options": options,
             })
         except urllib.error.HTTPError as he:
             # Retry without JSON formatting on server errors (often fixes 500s)
@@ -1003,21 +2077,25 @@ Return only valid JSON with the fields above.""""""
                     result = _post_ollama({
                         "model": os.getenv("OLLAMA_MODEL", "llama3.2:1b"),
                         "prompt": retry_prompt,
-                        "stream": False,
+                        "stream": True,
+                        "options": options,
                     })
                 except Exception as e:
                     self.logger.warning(f"Ollama retry failed: {e}")
+                    self._ollama_alive_until = 0.0
                     return None
             else:
                 self.logger.warning(f"Ollama HTTP error: {he}")
                 return None
         except (urllib.error.URLError, TimeoutError) as e:
             self.logger.warning(f"Cannot connect to Ollama: {e}")
+            self._ollama_alive_until = 0.0
             return None
 
+        self._ollama_alive_until = time.monotonic() + _OLLAMA_ALIVE_TTL
         extracted_text = result.get("response", "")
         try:
-            extracted_data = json.loads(extracted_text)
+            extracted_data = _json_loads(extracted_text)
             self.logger.info(f"Ollama extracted {len(extracted_data)} fields")
             return extracted_data
         except json.JSONDecodeError:
@@ -1028,28 +2106,95 @@ Return only valid JSON with the fields above.""""""
         """Fallback regex-based extraction for FileMaker data"""
         raw_part_number = self._extract_part_number_with_op(results)
         formatted_part_number = self._format_part_number_for_filemaker(raw_part_number)
+        scanned = self._scan_all(results)
         
         return {
             "Whittaker_Shipper": po_number,  # PO Number for FileMaker
-            "MJO_NO": self._extract_production_order(results),      # Production Order
-            "QTY_SHIP": self._extract_quantity_shipped(results),    # Quantity Shipped  
+            "MJO_NO": scanned.get("production_order", ""),      # Production Order
+            "QTY_SHIP": scanned.get("quantity_shipped", ""),    # Quantity Shipped  
             "PART_NUMBER": formatted_part_number,  # Part Number with OP## formatted for FileMaker
-            "Promise_Delivery_Date": self._extract_delivery_date(results),  # Promise Delivery Date
+            "Promise_Delivery_Date": scanned.get("delivery_date", ""),  # Promise Delivery Date
             "DPAS_Rating": self._extract_dpas_rating(results),      # DPAS Rating
-            "Payment_Terms_Flag": self._check_payment_terms(results),  # Payment Terms Check
+            "Payment_Terms_Flag": scanned.get("payment_terms", ""),  # Payment Terms Check
             "Quality_Clauses": self._extract_quality_clauses(results),  # Q# codes for Notes
             # Additional useful fields
             "vendor": self._extract_vendor(results),
-            "vendor_number": self._extract_vendor_number(results),
-            "date": self._extract_date(results),
-            "amount": self._extract_amount(results),
-            "buyer_name": self._extract_buyer_name(results),
-            "buyer_phone": self._extract_buyer_phone(results),
-            "buyer_email": self._extract_buyer_email(results)
+            "vendor_number": scanned.get("vendor_number", ""),
+            "date": scanned.get("date", ""),
+            "amount": scanned.get("amount", ""),
+            "buyer_name": scanned.get("buyer_name", ""),
+            "buyer_phone": scanned.get("buyer_phone", ""),
+            "buyer_email": scanned.get("buyer_email", "")
         }
     
-    def _process_with_pdfplumber(self, pdf_path: Path, output_dir: Path) -> Dict[str, Any]:
-        """Process PDF using pdfplumber (fallback)"""
+    def _process_with_pypdfium2(self, pdf_path: Path, output_dir: Path) -> Dict[str, Any]:
+        """Process PDF using pypdfium2 (fast plain-text fallback)"""
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_c
+
+        self.logger.info("Processing with pypdfium2...")
+
+        results = {
+            "source_file": str(pdf_path),
+            "pages": [],
+            "total_pages": 0,
+            "backend": "pypdfium2",
+            "total_text_length": 0,
+            "total_images": 0
+        }
+
+        encoded_pages = []
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            total_pages = len(pdf)
+            results["total_pages"] = total_pages
+            results["pages"] = [None] * total_pages
+
+            for page_num in range(total_pages):
+                page = pdf[page_num]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        # PDFium separates lines with CRLF; the extractors expect \n
+                        text = textpage.get_text_range().replace("\r\n", "\n")
+                    finally:
+                        textpage.close()
+                    images_found = sum(1 for _ in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,)))
+                finally:
+                    page.close()
+
+                results["pages"][page_num] = {
+                    "page_number": page_num + 1,
+                    "text": text,
+                    "text_length": len(text),
+                    "images_found": images_found,
+                    "has_text": _has_text(text)
+                }
+                encoded_pages.append(text.encode("utf-8"))
+        finally:
+            pdf.close()
+
+        results["total_text_length"] = sum(page["text_length"] for page in results["pages"])
+        results["total_images"] = sum(page["images_found"] for page in results["pages"])
+
+        # Save page text (opt-in) and combined text
+        text_files = []
+        if self._save_per_page_text():
+            for page_num, encoded in enumerate(encoded_pages, 1):
+                text_files.append((output_dir / f"page_{page_num:03d}.txt", encoded))
+        text_files.append((output_dir / f"{pdf_path.stem}_combined.txt", _with_page_breaks(encoded_pages)))
+        _write_files(text_files)
+
+        return results
+
+    def _process_with_pdfplumber(self, pdf_path: Path, output_dir: Path,
+                                 high_fidelity_layout: bool = False) -> Dict[str, Any]:
+        """Process PDF using pdfplumber (fallback)
+
+        By default text is read straight from page.chars, bypassing
+        pdfplumber's layout clustering. Pass high_fidelity_layout=True to use
+        page.extract_text() instead.
+        """
         import pdfplumber
         
         self.logger.info("Processing with pdfplumber...")
@@ -1063,32 +2208,58 @@ Return only valid JSON with the fields above.""""""
             "total_images": 0
         }
         
-        with pdfplumber.open(pdf_path) as pdf:
-            results["total_pages"] = len(pdf.pages)
+        # laparams=None (the default) keeps pdfminer's layout analysis disabled
+        total_text_length = 0
+        total_images = 0
+        encoded_pages = []
+        per_page = self._save_per_page_text()
+
+        # pdfminer issues many small reads and seeks while parsing; PO PDFs
+        # are small, so parse from an in-memory copy instead of the file.
+        # A background writer saves page N while page N+1 is being parsed.
+        with ThreadPoolExecutor(max_workers=1) as writer, \
+                pdfplumber.open(io.BytesIO(Path(pdf_path).read_bytes()), laparams=None) as pdf:
+            writes = []
+            total_pages = len(pdf.pages)
+            results["total_pages"] = total_pages
+            results["pages"] = [None] * total_pages
             
             for page_num, page in enumerate(pdf.pages):
-                text = page.extract_text() or ""
+                if high_fidelity_layout:
+                    text = page.extract_text() or ""
+                else:
+                    text = _fast_page_text(page)
                 
+                text_length = len(text)
                 page_result = {
                     "page_number": page_num + 1,
                     "text": text,
-                    "text_length": len(text),
-                    "images_found": len(page.images),
-                    "has_text": bool(text.strip())
+                    "text_length": text_length,
+                    "images_found": len(page.images) if _page_has_xobject(page) else 0,
+                    "has_text": _has_text(text)
                 }
                 
-                results["pages"].append(page_result)
-                results["total_text_length"] += len(text)
-                results["total_images"] += len(page.images)
+                results["pages"][page_num] = page_result
+                total_text_length += text_length
+                total_images += page_result["images_found"]
                 
-                # Save page text
-                text_file = output_dir / f"page_{page_num + 1:03d}.txt"
-                text_file.write_text(text, encoding='utf-8')
-        
-        # Save combined text
-        all_text = "\n\n--- PAGE BREAK ---\n\n".join([p["text"] for p in results["pages"]])
-        combined_file = output_dir / f"{pdf_path.stem}_combined.txt"
-        combined_file.write_text(all_text, encoding='utf-8')
+                encoded = text.encode("utf-8")
+                encoded_pages.append(encoded)
+                if per_page:
+                    # Save page text
+                    writes.append(writer.submit(
+                        _write_files, [(output_dir / f"page_{page_num + 1:03d}.txt", encoded)]
+                    ))
+
+            # Save combined text
+            writes.append(writer.submit(
+                _write_files, [(output_dir / f"{pdf_path.stem}_combined.txt", _with_page_breaks(encoded_pages))]
+            ))
+            for write in writes:
+                write.result()  # re-raise any write error
+
+        results["total_text_length"] = total_text_length
+        results["total_images"] = total_images
         
         return results
 
@@ -1096,9 +2267,22 @@ Return only valid JSON with the fields above.""""""
         self.logger.info("Sample logging statement added for demonstration purposes.")
 
 
-def setup_environment():
+def setup_environment(force: bool = False):
     """Setup script for fixing PyMuPDF installation"""
+    import subprocess
+
     print("🔧 Setting up environment...")
+
+    # Only reinstall when PyMuPDF is actually broken. The unrelated "fitz"
+    # package imports fine but has no fitz.open, so exercise that too.
+    if not force:
+        try:
+            import fitz
+            fitz.open().close()
+            print("✅ PyMuPDF already healthy (use --force to reinstall)")
+            return True
+        except (ImportError, AttributeError) as e:
+            print(f"⚠️  PyMuPDF not usable: {e}")
     
     try:
         # Try to fix PyMuPDF installation
@@ -1107,8 +2291,10 @@ def setup_environment():
             sys.executable, "-m", "pip", "uninstall", "-y", "PyMuPDF", "fitz"
         ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
+        # Wheels only: never fall back to a slow source build of MuPDF
         subprocess.check_call([
-            sys.executable, "-m", "pip", "install", "--no-cache-dir", "PyMuPDF==1.23.8"
+            sys.executable, "-m", "pip", "install", "--no-cache-dir",
+            "--only-binary=:all:", "PyMuPDF==1.23.8"
         ])
         
         print("✅ PyMuPDF installation fixed")
@@ -1118,71 +2304,111 @@ def setup_environment():
         return False
 
 
+def _incoming_pdfs(input_dir: str) -> List[Path]:
+    """PDF files in input_dir, matching the extension in any case (.pdf, .PDF)"""
+    try:
+        with os.scandir(input_dir) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.lower().endswith(".pdf") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _print_lines(lines: List[str]):
+    """Print a per-PDF report as one stdout write.
+
+    The container runs with PYTHONUNBUFFERED=1, where every print() is its
+    own write (and its own log record for the docker log driver).
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def main():
     """Main entry point"""
+    _limit_tesseract_threads()
     if "--fix-deps" in sys.argv:
-        setup_environment()
+        setup_environment(force="--force" in sys.argv)
         return
     
     if "--health" in sys.argv:
-        pipeline = UnifiedOCRPipeline()
-        health = pipeline.health_check()
+        health = UnifiedOCRPipeline.quick_health()
         print(json.dumps(health, indent=2))
         return
     
-    # Initialize pipeline
-    pipeline = UnifiedOCRPipeline()
+    # The pipeline (logging, backend imports, OCR engines) is only built
+    # once there is a PDF to process
+    pipeline = None
 
     # Check if PDF file provided
-    pdf_files = [arg for arg in sys.argv[1:] if arg.endswith('.pdf')]
+    pdf_files = [arg for arg in sys.argv[1:]
+                 if not arg.startswith('--') and Path(arg).suffix.lower() == '.pdf']
 
     if pdf_files:
-        for pdf_file in pdf_files:
-            try:
-                results = pipeline.process_pdf(pdf_file)
-                print(f"\n✅ Processed: {pdf_file}")
-                print(f"📄 Pages: {results['total_pages']}")
-                print(f"📝 Text length: {results['total_text_length']} characters")
-                print(f"🖼️  Images: {results['total_images']}")
-                print(f"⏱️  Time: {results['processing_time_seconds']:.2f}s")
-            except Exception as e:
-                print(f"❌ Failed to process {pdf_file}: {e}")
+        pipeline = UnifiedOCRPipeline()
+        workers = min(_default_file_workers(pipeline.config), len(pdf_files))
+        for pdf_file, results, error in _process_files(pipeline, pdf_files, workers):
+            if error is not None:
+                print(f"❌ Failed to process {pdf_file}: {error}")
+                continue
+            _print_lines([
+                f"\n✅ Processed: {pdf_file}",
+                f"📄 Pages: {results['total_pages']}",
+                f"📝 Text length: {results['total_text_length']} characters",
+                f"🖼️  Images: {results['total_images']}",
+                f"⏱️  Time: {results['processing_time_seconds']:.2f}s",
+            ])
     else:
         # Auto-process all PDFs in IncomingPW directory
         input_dir = os.getenv("OCR_INCOMING", "/app/IncomingPW")
         delete_source = os.getenv("DELETE_SOURCE_FILES", "true").lower() == "true"
         
-        pdfs = list(Path(input_dir).glob("*.pdf"))
+        pdfs = _incoming_pdfs(input_dir)
         if pdfs:
-            print(f"Found {len(pdfs)} PDF(s) in {input_dir}. Processing one by one...")
+            pipeline = UnifiedOCRPipeline()
+            workers = min(_default_file_workers(pipeline.config), len(pdfs))
+            print(f"Found {len(pdfs)} PDF(s) in {input_dir}. Processing with {workers} worker(s)...")
             if delete_source:
                 print("🗑️  Source files will be deleted after successful processing")
             
-            for pdf_file in pdfs:
-                try:
-                    print(f"\n🔄 Processing: {pdf_file.name}")
-                    results = pipeline.process_pdf(str(pdf_file))
-                    po_number = results.get("po_number", "UNKNOWN")
-                    
-                    print(f"✅ Successfully processed: {pdf_file.name}")
-                    print(f"📋 PO Number: {po_number}")
-                    print(f"📄 Pages: {results['total_pages']}")
-                    print(f"📝 Text length: {results['total_text_length']} characters")
-                    print(f"🖼️  Images: {results['total_images']}")
-                    print(f"⏱️  Time: {results['processing_time_seconds']:.2f}s")
-                    
-                    # Delete source file after successful processing
-                    if delete_source:
-                        try:
-                            pdf_file.unlink()
-                            print(f"🗑️  Deleted source file: {pdf_file.name}")
-                        except Exception as delete_error:
-                            print(f"⚠️  Could not delete {pdf_file.name}: {delete_error}")
-                            
-                except Exception as e:
-                    print(f"❌ Failed to process {pdf_file.name}: {e}")
-                    print(f"🔄 Continuing with next file...")
+            # Source deletes go to a small thread pool so a slow unlink on
+            # the input share never holds up reporting the next result
+            delete_pool = ThreadPoolExecutor(max_workers=2) if delete_source else None
+            deletions = []
+
+            for pdf_name, results, error in _process_files(pipeline, [str(pdf) for pdf in pdfs], workers):
+                pdf_file = Path(pdf_name)
+                if error is not None:
+                    _print_lines([
+                        f"❌ Failed to process {pdf_file.name}: {error}",
+                        "🔄 Continuing with next file...",
+                    ])
                     # Do not delete file if processing failed
+                    continue
+
+                po_number = results.get("po_number", "UNKNOWN")
+                
+                _print_lines([
+                    f"✅ Successfully processed: {pdf_file.name}",
+                    f"📋 PO Number: {po_number}",
+                    f"📄 Pages: {results['total_pages']}",
+                    f"📝 Text length: {results['total_text_length']} characters",
+                    f"🖼️  Images: {results['total_images']}",
+                    f"⏱️  Time: {results['processing_time_seconds']:.2f}s",
+                ])
+                
+                # Delete source file after successful processing
+                if delete_pool is not None:
+                    deletions.append((pdf_file, delete_pool.submit(pdf_file.unlink)))
+
+            if delete_pool is not None:
+                for pdf_file, deletion in deletions:
+                    delete_error = deletion.exception()
+                    if delete_error is None:
+                        print(f"🗑️  Deleted source file: {pdf_file.name}")
+                    else:
+                        print(f"⚠️  Could not delete {pdf_file.name}: {delete_error}")
+                delete_pool.shutdown()
                     
         else:
             print("No PDF files found in IncomingPW directory.")
@@ -1190,14 +2416,17 @@ def main():
             print("Usage:")
             print("  python unified_ocr_pipeline.py file.pdf [file2.pdf ...]")
             print("  python unified_ocr_pipeline.py --health")
-            print("  python unified_ocr_pipeline.py --fix-deps")
+            print("  python unified_ocr_pipeline.py --fix-deps [--force]")
             print(f"\nInput folder: {input_dir}")
             print("Output folder: /volume1/Main/Main/ProcessedPOs")
             # Show health status
-            health = pipeline.health_check()
+            health = UnifiedOCRPipeline.quick_health()
             print(f"\n🏥 Status: {health['status']}")
             print(f"🔧 Backend: {health['pdf_backend']}")
 
+    if pipeline is not None:
+        pipeline.close()
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,29 +3,36 @@
 Test script for Enhanced OCR capabilities
 """
 
+import argparse
 import os
 import sys
 import tempfile
 from pathlib import Path
 
+# Single-threaded Tesseract: must be set before libtesseract is loaded
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 # Add scripts directory to path
 sys.path.insert(0, '/volume1/Main/Main/scripts/unified_ocr_pipeline/scripts')
 
 from unified_ocr_pipeline import UnifiedOCRPipeline
 
-def test_enhanced_ocr():
+def test_enhanced_ocr(workers=None):
     """Test the enhanced OCR processing"""
     print("🧪 Testing Enhanced OCR Pipeline")
     print("=" * 50)
     
-    # Initialize pipeline
-    pipeline = UnifiedOCRPipeline()
+    # Initialize pipeline; page_workers sizes the page-analysis process pool
+    pipeline = UnifiedOCRPipeline({"page_workers": workers} if workers else None)
     
     # Check health
     health = pipeline.health_check()
     print(f"🏥 Pipeline Status: {health['status']}")
     print(f"🔧 PDF Backend: {health['pdf_backend']}")
+    print(f"🔤 OCR Model: {health['ocr_model']}")
     print(f"📦 Dependencies: {health['dependencies']}")
+    print(f"🧵 OMP_THREAD_LIMIT: {os.environ.get('OMP_THREAD_LIMIT')}")
     
     # Test with existing PO
     test_file = "/volume1/Main/Main/scripts/unified_ocr_pipeline/output/ProcessedPOs/4551230999/4551230999_PO.pdf"
@@ -40,6 +47,7 @@ def test_enhanced_ocr():
             print(f"📄 Total Pages: {results['total_pages']}")
             print(f"📝 Total Text Length: {results['total_text_length']}")
             print(f"⏱️  Processing Time: {results['processing_time_seconds']:.2f}s")
+            print(f"🗃️  OCR Cache: {pipeline.cache_stats()}")
             
             # Show quality assessment for each page
             for page in results['pages']:
@@ -67,5 +75,10 @@ def test_enhanced_ocr():
                     if pdf_files:
                         print(f"   {pdf_files[0]}")
 
+    pipeline.close()
+
 if __name__ == "__main__":
-    test_enhanced_ocr()
+    parser = argparse.ArgumentParser(description="Test the enhanced OCR pipeline")
+    parser.add_argument("--workers", type=int, help="Page worker processes (default: OCR_PAGE_WORKERS or min(CPUs, 4))")
+    args = parser.parse_args()
+    test_enhanced_ocr(args.workers)